@@ -0,0 +1,29 @@
+"""
+Pagination classes for the Taxonomy connector APIs.
+"""
+from rest_framework.pagination import CursorPagination
+
+
+class IdCursorPagination(CursorPagination):
+    """
+    Keyset pagination on the primary key.
+
+    Pages are fetched with `WHERE id > <cursor> ORDER BY id LIMIT <page_size>`, so neither a `COUNT(*)` nor an
+    `OFFSET` scan is needed and the cost of a page does not grow with its position in the table.
+
+    Pagination is opt-in: only requests with a `cursor` or `page_size` query parameter are paginated, the others
+    keep receiving the whole list, unwrapped, as before.
+    """
+    ordering = 'id'
+    page_size = 100
+    page_size_query_param = 'page_size'
+    max_page_size = 500
+
+    def paginate_queryset(self, queryset, request, view=None):
+        """
+        Paginate the queryset only if the request asks for a page.
+        """
+        query_params = request.query_params
+        if self.cursor_query_param not in query_params and self.page_size_query_param not in query_params:
+            return None
+        return super().paginate_queryset(queryset, request, view)
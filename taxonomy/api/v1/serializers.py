@@ -57,11 +57,13 @@ class JobsListSerializer(ModelSerializer):
     def get_skills(self, instance):
         """
         Get JobSkill records.
+
+        Uses the `whitelisted_job_skills` prefetched by the view when available.
         """
-        return JobSkillSerializer(
-            JobSkills.get_whitelisted_job_skill_qs().filter(job=instance),
-            many=True,
-        ).data
+        job_skills = getattr(instance, 'whitelisted_job_skills', None)
+        if job_skills is None:
+            job_skills = JobSkills.get_whitelisted_job_skill_qs().filter(job=instance).select_related('skill')
+        return JobSkillSerializer(job_skills, many=True).data
 
 
 class CourseSkillsSerializer(ModelSerializer):
@@ -80,8 +82,8 @@ class XBlockSkillDataSerializer(ModelSerializer):
 
 
 class SkillListSerializer(ModelSerializer):
-    courses = CourseSkillsSerializer(source='courseskills_set.all', many=True)
-    xblocks = XBlockSkillDataSerializer(source='xblockskilldata_set.all', many=True)
+    courses = CourseSkillsSerializer(source='active_courseskills', many=True)
+    xblocks = XBlockSkillDataSerializer(source='active_xblockskilldata', many=True)
 
     class Meta:
         model = Skill
@@ -139,8 +141,10 @@ class XBlocksSkillsSerializer(ModelSerializer):
 class ShortSkillSubcategorySerializer(ModelSerializer):
     """
     Serializer to get only id, name and skills of SkillSubcategory.
+
+    Instances are dictionaries with `id`, `name` and `skills` keys.
     """
-    skills = ShortSkillSerializer(source='skill_set', many=True)
+    skills = ShortSkillSerializer(many=True)
 
     class Meta:
         model = SkillSubCategory
@@ -150,9 +154,11 @@ class ShortSkillSubcategorySerializer(ModelSerializer):
 class SkillCategorySerializer(ModelSerializer):
     """
     Serializer to get SkillCategory fields.
+
+    Instances are dictionaries with `id`, `name`, `skills` and `skills_subcategories` keys.
     """
-    skills = ShortSkillSerializer(source='skill_set', many=True)
-    skills_subcategories = ShortSkillSubcategorySerializer(source='skillsubcategory_set', many=True)
+    skills = ShortSkillSerializer(many=True)
+    skills_subcategories = ShortSkillSubcategorySerializer(many=True)
 
     class Meta:
         model = SkillCategory
@@ -170,7 +176,7 @@ class JobSkillCategorySerializer(ModelSerializer):
         fields = ('id', 'name', 'skill_categories')
 
     def get_skill_categories(self, __):
-        """get skill_categories queryset from context and serializing it using SkillCategorySerializer."""
+        """get skill_categories from context and serializing it using SkillCategorySerializer."""
         return SkillCategorySerializer(
             self.context['skill_categories'], many=True
         ).data
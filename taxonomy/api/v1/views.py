@@ -1,7 +1,8 @@
 """
 Taxonomy API views.
 """
-from collections import OrderedDict
+import json
+from functools import cached_property
 
 from django_filters.rest_framework import DjangoFilterBackend
 from edx_django_utils.cache import TieredCache, get_cache_key
@@ -13,10 +14,13 @@ from rest_framework.response import Response
 from rest_framework.views import APIView
 from rest_framework.viewsets import GenericViewSet, ModelViewSet
 
-from django.db.models import Count, Prefetch, Sum
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import Max, Prefetch
+from django.http import Http404, StreamingHttpResponse
 from django.shortcuts import get_object_or_404
 
 from taxonomy.api.filters import SkillNameFilter, XBlocksFilter
+from taxonomy.api.pagination import IdCursorPagination
 from taxonomy.api.permissions import IsOwner
 from taxonomy.api.v1.serializers import (
     CurrentJobSerializer,
@@ -28,19 +32,20 @@ from taxonomy.api.v1.serializers import (
     SkillsQuizSerializer,
     XBlocksSkillsSerializer,
 )
-from taxonomy.constants import CACHE_TIMEOUT_XBLOCK_SKILLS_SECONDS
+from taxonomy.constants import CACHE_TIMEOUT_JOB_TOP_SKILL_CATEGORIES_SECONDS, CACHE_TIMEOUT_XBLOCK_SKILLS_SECONDS
 from taxonomy.models import (
     CourseSkills,
     Job,
     JobPostings,
+    JobSkillCategoryRollup,
+    JobSkills,
     Skill,
-    SkillCategory,
     SkillsQuiz,
-    SkillSubCategory,
     SkillValidationConfiguration,
     XBlockSkillData,
     XBlockSkills,
 )
+from taxonomy.utils import get_job_top_skill_categories_cache_key
 
 
 class TaxonomyAPIViewSetMixin:
@@ -59,19 +64,29 @@ class SkillViewSet(TaxonomyAPIViewSetMixin, RetrieveModelMixin, ListModelMixin,
     serializer_class = SkillListSerializer
     filter_backends = (DjangoFilterBackend,)
     filterset_class = SkillNameFilter
+    pagination_class = IdCursorPagination
 
     def get_queryset(self):
         """
         Get all the skills with prefetch_related objects.
+
+        Prefetched course and xblock skills only load the columns used by the serializer and are stored in
+        `active_courseskills` and `active_xblockskilldata` lists.
         """
         return Skill.objects.all().prefetch_related(
             Prefetch(
                 'courseskills_set',
-                queryset=CourseSkills.objects.filter(is_blacklisted=False)
+                queryset=CourseSkills.objects.filter(is_blacklisted=False).only(
+                    'skill', 'course_key', 'confidence',
+                ),
+                to_attr='active_courseskills',
             ),
             Prefetch(
                 'xblockskilldata_set',
-                queryset=XBlockSkillData.objects.filter(is_blacklisted=False).select_related('xblock')
+                queryset=XBlockSkillData.objects.filter(is_blacklisted=False).select_related('xblock').only(
+                    'skill', 'xblock__usage_key', 'verified_count', 'ignored_count', 'verified', 'confidence',
+                ),
+                to_attr='active_xblockskilldata',
             ),
         )
 
@@ -81,13 +96,18 @@ class JobsViewSet(TaxonomyAPIViewSetMixin, RetrieveModelMixin, ListModelMixin, G
     ViewSet to list and retrieve all Jobs in the system.
     """
     serializer_class = JobsListSerializer
+    pagination_class = IdCursorPagination
 
     def get_queryset(self):
         """
-        Get all the jobs with prefetch_related objects.
+        Get all the jobs with their whitelisted job skills prefetched.
         """
         return Job.objects.all().prefetch_related(
-            'jobskills_set', 'jobskills_set__skill'
+            Prefetch(
+                'jobskills_set',
+                queryset=JobSkills.get_whitelisted_job_skill_qs().select_related('skill').defer('created', 'modified'),
+                to_attr='whitelisted_job_skills',
+            )
         )
 
 
@@ -98,6 +118,7 @@ class JobTopSkillCategoriesAPIView(APIView):
     """
     permission_classes = [permissions.IsAdminUser]
     throttle_scope = 'taxonomy-api-throttle-scope'
+    TOP_SKILL_CATEGORIES_COUNT = 5
 
     def get(self, request, job_id):
         """
@@ -144,48 +165,99 @@ class JobTopSkillCategoriesAPIView(APIView):
         }
 
         """
-        job = get_object_or_404(Job, id=job_id)
-        skill_categories = SkillCategory.objects.filter(
-            skills__jobskills__job=job
-        ).prefetch_related(
-            Prefetch(
-                'skill_set',
-                queryset=Skill.objects.filter(jobskills__job=job).distinct()
-            ),
-            Prefetch(
-                'skillsubcategory_set',
-                queryset=SkillSubCategory.objects.filter(skills__jobskills__job=job).distinct().prefetch_related(
-                    Prefetch(
-                        'skill_set',
-                        queryset=Skill.objects.filter(jobskills__job=job).distinct()
-                    )
-                )
-            ),
-        ).annotate(
-            total_significance=Sum('skills__jobskills__significance'),
-            total_unique_postings=Sum('skills__jobskills__unique_postings'),
-            total_skills=Count('skills'),
-        ).order_by(
-            '-total_significance', '-total_unique_postings', '-total_skills'
-        )[:5]
+        cache_key = get_job_top_skill_categories_cache_key(job_id)
+        cached_response = TieredCache.get_cached_response(cache_key)
+        if cached_response.is_found:
+            return Response(cached_response.value)
+
+        job = get_object_or_404(Job.objects.only('id', 'name'), id=job_id)
+        skill_categories = self.get_top_skill_categories(job)
 
         response_data = JobSkillCategorySerializer(job, context={'skill_categories': skill_categories}).data
+        TieredCache.set_all_tiers(cache_key, response_data, CACHE_TIMEOUT_JOB_TOP_SKILL_CATEGORIES_SECONDS)
         return Response(response_data)
 
+    def get_top_skill_categories(self, job):
+        """
+        Get the top skill categories of the job along with their job related skills and subcategories.
+
+        The top categories are read from the precomputed `JobSkillCategoryRollup` totals, then the job skills of
+        only those categories are fetched in a single query and grouped by category and subcategory here.
+
+        Arguments:
+            job (Job): Job whose top skill categories are needed.
+
+        Returns:
+            (list<dict>): Top skill categories ordered by total significance, total unique postings and
+                total skills of the job.
+        """
+        top_category_rollups = JobSkillCategoryRollup.objects.filter(
+            job=job,
+        ).order_by(
+            '-total_significance', '-total_unique_postings', '-total_skills', 'category_id'
+        ).values(
+            'category_id', 'category__name'
+        )[:self.TOP_SKILL_CATEGORIES_COUNT]
+
+        skill_categories = {
+            rollup['category_id']: {
+                'id': rollup['category_id'],
+                'name': rollup['category__name'],
+                'skills': [],
+                'subcategories': {},
+            }
+            for rollup in top_category_rollups
+        }
+        if not skill_categories:
+            return []
+
+        job_skills = JobSkills.objects.filter(
+            job=job,
+            skill__category_id__in=skill_categories,
+        ).order_by(
+            'skill__created', 'skill_id'
+        ).values(
+            'skill_id',
+            'skill__name',
+            'skill__category_id',
+            'skill__subcategory_id',
+            'skill__subcategory__name',
+        )
+        for job_skill in job_skills:
+            skill = {'id': job_skill['skill_id'], 'name': job_skill['skill__name']}
+            skill_category = skill_categories[job_skill['skill__category_id']]
+            skill_category['skills'].append(skill)
+
+            if job_skill['skill__subcategory_id'] is not None:
+                skill_subcategory = skill_category['subcategories'].setdefault(job_skill['skill__subcategory_id'], {
+                    'id': job_skill['skill__subcategory_id'],
+                    'name': job_skill['skill__subcategory__name'],
+                    'skills': [],
+                })
+                skill_subcategory['skills'].append(skill)
+
+        top_skill_categories = list(skill_categories.values())
+        for skill_category in top_skill_categories:
+            skill_category['skills_subcategories'] = sorted(
+                skill_category.pop('subcategories').values(), key=lambda subcategory: subcategory['id']
+            )
+        return top_skill_categories
+
 
 class JobPostingsViewSet(TaxonomyAPIViewSetMixin, RetrieveModelMixin, ListModelMixin, GenericViewSet):
     """
     ViewSet to list and retrieve all JobPostings in the system.
     """
     serializer_class = JobPostingsSerializer
+    pagination_class = IdCursorPagination
 
     def get_queryset(self):
         """
-        Get all the jobpostings with prefetch_related objects.
+        Get all the jobpostings with their jobs.
+
+        Each job has a single job posting, so the jobs are joined rather than prefetched.
         """
-        return JobPostings.objects.all().select_related(
-            'job'
-        )
+        return JobPostings.objects.select_related('job')
 
 
 class SkillsQuizViewSet(TaxonomyAPIViewSetMixin, ModelViewSet):
@@ -196,9 +268,30 @@ class SkillsQuizViewSet(TaxonomyAPIViewSetMixin, ModelViewSet):
     permission_classes = (permissions.IsAuthenticated, IsOwner | permissions.IsAdminUser, )
     filter_backends = (DjangoFilterBackend, OrderingFilter, )
     filterset_fields = ('username', )
+    STREAM_CHUNK_SIZE = 500
 
     queryset = SkillsQuiz.objects.all()
 
+    def list(self, request, *args, **kwargs):
+        """
+        List skills quizzes, streamed as JSON Lines when `?stream=1` is passed.
+
+        The streamed response is read from the database in chunks of `STREAM_CHUNK_SIZE` quizzes, with skills and
+        future jobs prefetched per chunk, so memory use does not grow with the number of quizzes.
+        """
+        if request.query_params.get('stream') != '1':
+            return super().list(request, *args, **kwargs)
+
+        queryset = self.filter_queryset(self.get_queryset())
+        if not queryset.ordered:
+            queryset = queryset.order_by('id')
+
+        def stream_quizzes():
+            for skills_quiz in queryset.iterator(chunk_size=self.STREAM_CHUNK_SIZE):
+                yield json.dumps(self.get_serializer(skills_quiz).data, cls=DjangoJSONEncoder) + '\n'
+
+        return StreamingHttpResponse(stream_quizzes(), content_type='application/x-ndjson')
+
     def perform_create(self, serializer):
         """
         Attach the User to the SkillsQuiz Model by overriding perform_create method.
@@ -214,7 +307,7 @@ class SkillsQuizViewSet(TaxonomyAPIViewSetMixin, ModelViewSet):
         if not self.request.user.is_staff:
             queryset = queryset.filter(username=self.request.user.username)
 
-        return queryset.all().select_related('current_job').prefetch_related('skills', 'future_jobs')
+        return queryset.select_related('current_job').prefetch_related('skills', 'future_jobs')
 
 
 class LearnersCurrentJobAPIView(TaxonomyAPIViewSetMixin, ListAPIView):
@@ -282,14 +375,17 @@ class JobHolderUsernamesAPIView(APIView):
             ]
         }
         """
-        job = get_object_or_404(Job, id=job_id)
+        if not Job.objects.filter(id=job_id).exists():
+            raise Http404
 
+        # Let the database de-duplicate usernames and order them by their most recent quiz attempt.
         usernames_queryset = SkillsQuiz.objects.filter(
-            current_job=job,
-        ).order_by('-id').values_list('username', flat=True)[:5000]
-        usernames = list(OrderedDict.fromkeys(usernames_queryset))[:100]
+            current_job_id=job_id,
+        ).values('username').annotate(
+            last_id=Max('id'),
+        ).order_by('-last_id').values_list('username', flat=True)[:100]
 
-        return Response({"usernames": usernames})
+        return Response({"usernames": list(usernames_queryset)})
 
 
 class XBlockSkillsViewSet(TaxonomyAPIViewSetMixin, RetrieveModelMixin, ListModelMixin, GenericViewSet):
@@ -302,14 +398,23 @@ class XBlockSkillsViewSet(TaxonomyAPIViewSetMixin, RetrieveModelMixin, ListModel
     filter_backends = (DjangoFilterBackend,)
     filterset_class = XBlocksFilter
 
-    def get_queryset(self):
+    @cached_property
+    def skill_validation_disabled(self):
         """
-        Get all the xblocks skills with prefetch_related objects.
+        Return True if skill validation is disabled for the course in the request.
+
+        DRF may call `get_queryset` more than once per request, the view instance lives for
+        a single request so the value is memoized on it.
         """
-        skill_validation_disabled = SkillValidationConfiguration.is_disabled(
+        return SkillValidationConfiguration.is_disabled(
             self.request.query_params.get('course_key')
         )
-        if skill_validation_disabled:
+
+    def get_queryset(self):
+        """
+        Get all the xblocks skills with prefetch_related objects.
+        """
+        if self.skill_validation_disabled:
             return XBlockSkills.objects.none()
 
         return XBlockSkills.objects.prefetch_related(
@@ -4,12 +4,27 @@ Constants used by the taxonomy connector.
 """
 
 from datetime import date
+from functools import lru_cache
 
 from dateutil.relativedelta import relativedelta
 
 from django.conf import settings
 
 
+@lru_cache(maxsize=1)
+def get_active_date_window(today):
+    """
+    Get the start and end dates of the six month window used for querying active jobs from the EMSI Service.
+
+    Arguments:
+        today (date): The date on which the window ends.
+
+    Returns:
+        tuple: Start and end dates of the window as ISO formatted strings.
+    """
+    return str(today - relativedelta(months=6)), str(today)
+
+
 def get_lookup_query_filter(external_ids):
     """
     Build query filter for the lookup endpoint.
@@ -31,11 +46,12 @@ def get_job_query_filter(skills=None, industry=None):
     Returns:
         dict: Job postings query filter to used in EMSI API
     """
+    start, end = get_active_date_window(date.today())
     jobs_query_filter = {
         'filter': {
             'when': {
-                'start': str(date.today() - relativedelta(months=6)),
-                'end': str(date.today()),
+                'start': start,
+                'end': end,
                 'type': 'active'
             },
         },
@@ -75,11 +91,12 @@ def get_job_posting_query_filter(jobs=None):
     Returns:
         dict: Job postings query filter to used in EMSI API
     """
+    start, end = get_active_date_window(date.today())
     job_posting_query_filter = {
         'filter': {
             'when': {
-                'start': str(date.today() - relativedelta(months=6)),
-                'end': str(date.today()),
+                'start': start,
+                'end': end,
                 'type': 'active'
             }
         },
@@ -106,6 +123,11 @@ def get_job_posting_query_filter(jobs=None):
 
 AMAZON_TRANSLATION_ALLOWED_SIZE = 5000
 EMSI_API_RATE_LIMIT_PER_SEC = 5
+EMSI_PRODUCT_SKILLS_BATCH_SIZE = 50
+# Defaults of the settings of the same name, which are read by the EMSI clients on access.
+EMSI_CIRCUIT_BREAKER_FAILURE_THRESHOLD = 5
+EMSI_CIRCUIT_BREAKER_COOLDOWN_SECONDS = 60
+CHAT_COMPLETION_MAX_WORKERS = 40
 TRANSLATE_SERVICE = 'translate'
 ENGLISH = 'en'
 AUTO = 'auto'
@@ -148,3 +170,8 @@ JOB_SOURCE_INDUSTRY = 'industry'
 JOB_SKILLS_URL_NAME = 'job-skills'
 
 CACHE_TIMEOUT_XBLOCK_SKILLS_SECONDS = 60 * 60
+CACHE_TIMEOUT_SKILL_VALIDATION_SECONDS = 60
+CACHE_TIMEOUT_JOB_TOP_SKILL_CATEGORIES_SECONDS = 60 * 10
+CACHE_TIMEOUT_EMSI_SKILL_DETAILS_SECONDS = 60 * 60 * 24
+# Default of the `EMSI_SKILLS_CACHE_TTL` setting, which is read by the EMSI skills client on access.
+CACHE_TIMEOUT_EMSI_PRODUCT_SKILLS_SECONDS = 60 * 60 * 24 * 7
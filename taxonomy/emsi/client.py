@@ -3,38 +3,304 @@
 Clients for communicating with the EMSI Service.
 """
 
+import hashlib
+import inspect
 import logging
+import random
+import socket
+import threading
+import warnings
+from concurrent.futures import Future, ThreadPoolExecutor
 from functools import wraps
-from time import sleep, time
-from urllib.parse import urljoin
+from time import monotonic, sleep, time
+from urllib.parse import urlencode
 
+import orjson
 import requests
+from edx_django_utils.cache import get_cache_key
 from edx_rest_api_client.auth import BearerAuth
 from requests.adapters import HTTPAdapter
-from requests.exceptions import ConnectionError, RequestException, Timeout  # pylint: disable=redefined-builtin
+from requests.exceptions import (  # pylint: disable=redefined-builtin
+    ConnectionError,
+    HTTPError,
+    JSONDecodeError,
+    RequestException,
+    Timeout,
+)
 from urllib3 import Retry
+from urllib3.connection import HTTPConnection
 
 from django.conf import settings
-
-from taxonomy.constants import EMSI_API_RATE_LIMIT_PER_SEC
+from django.core.cache import DEFAULT_CACHE_ALIAS, cache, caches
+from django.core.cache.backends.dummy import DummyCache
+from django.core.cache.backends.locmem import LocMemCache
+from django.utils.html import strip_tags
+
+from taxonomy.constants import (
+    CACHE_TIMEOUT_EMSI_PRODUCT_SKILLS_SECONDS,
+    CACHE_TIMEOUT_EMSI_SKILL_DETAILS_SECONDS,
+    EMSI_API_RATE_LIMIT_PER_SEC,
+    EMSI_CIRCUIT_BREAKER_COOLDOWN_SECONDS,
+    EMSI_CIRCUIT_BREAKER_FAILURE_THRESHOLD,
+)
 from taxonomy.exceptions import TaxonomyAPIError
 
 LOGGER = logging.getLogger(__name__)
 
 
+def load_json(response, stream=False):
+    """
+    Parse the JSON body of an EMSI API response.
+
+    EMSI responses can be large, so they are parsed with `orjson` instead of `response.json()`. Parse errors are
+    raised as `requests.exceptions.JSONDecodeError` just like `response.json()` would.
+
+    The body of a response requested with `stream=True` is read from the connection in one piece, instead of
+    being buffered in chunks and then joined by `requests`.
+    """
+    content = response.raw.read(decode_content=True) if stream else response.content
+    try:
+        return orjson.loads(content)
+    except orjson.JSONDecodeError as error:
+        raise JSONDecodeError(error.msg, error.doc, error.pos) from error
+
+
+class LazySetting:
+    """
+    Class attribute that reads a Django setting when it is accessed instead of when the class is defined.
+
+    This keeps the clients in sync with the settings when they are changed after import, e.g. by `override_settings`.
+    """
+
+    def __init__(self, name, path=None, default=None):
+        """
+        Initialize the attribute with the name of the setting and an optional path to append to the setting's URL.
+
+        The setting is required unless a default value is given for it.
+        """
+        self.name = name
+        self.path = path.strip('/') if path else None
+        self.default = default
+
+    def __get__(self, instance, owner):
+        """
+        Return the current value of the setting.
+        """
+        if self.default is None:
+            value = getattr(settings, self.name)
+        else:
+            value = getattr(settings, self.name, self.default)
+        # Unlike `urljoin`, this keeps the path of the setting's URL, if it has one.
+        return f"{value.rstrip('/')}/{self.path}" if self.path else value
+
+
+class JitteredRetry(Retry):
+    """
+    Retry configuration that adds a random jitter of up to `backoff_factor` seconds to every backoff.
+
+    Without the jitter, the workers that got rate limited or hit a server error at the same time would all retry
+    at the same time again.
+    """
+
+    def get_backoff_time(self):
+        """
+        Return the exponential backoff time plus a random jitter.
+        """
+        return super().get_backoff_time() + random.uniform(0, self.backoff_factor)
+
+
+class CircuitBreaker:
+    """
+    Circuit breaker shared by all the clients of an EMSI API scope in a process.
+
+    After `failure_threshold` consecutive failed requests the circuit opens and requests fail right away, instead
+    of waiting for the rate limiter and the retries of a request that is bound to fail. Once `cooldown` seconds have
+    passed requests are let through again, the circuit closes on the first success and opens again on a failure.
+    """
+
+    def __init__(self, failure_threshold, cooldown):
+        """
+        Initialize the circuit breaker, closed.
+        """
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown
+        self.failures = 0
+        self.opened_at = None
+        self.lock = threading.Lock()
+
+    def allow_request(self):
+        """
+        Return True if the circuit is closed or its cooldown has passed, False otherwise.
+        """
+        with self.lock:
+            return self.opened_at is None or monotonic() - self.opened_at >= self.cooldown
+
+    def record_success(self):
+        """
+        Close the circuit.
+        """
+        with self.lock:
+            self.failures = 0
+            self.opened_at = None
+
+    def record_failure(self):
+        """
+        Count a failed request, opening the circuit once there are `failure_threshold` consecutive failures.
+        """
+        with self.lock:
+            self.failures += 1
+            if self.failures >= self.failure_threshold:
+                self.opened_at = monotonic()
+
+
+class RateLimiter:
+    """
+    Rate limiter shared by all the threads of a process, and by all the processes sharing the Django cache.
+
+    When the Django cache is shared between processes, requests are counted per second in the cache, so that the
+    rate limit holds across all the processes and not just within a single process.
+
+    Otherwise, requests take tokens from a bucket that holds up to `rate` tokens and is refilled continuously at
+    `rate` tokens per second, and wait just long enough for the next token when the bucket is empty.
+    """
+
+    def __init__(self, rate):
+        """
+        Initialize the limiter with a full bucket.
+
+        Arguments:
+            rate (int): Maximum number of requests allowed per second.
+        """
+        self.rate = rate
+        self.tokens = rate
+        self.refilled_at = monotonic()
+        self.lock = threading.Lock()
+
+    @staticmethod
+    def is_cache_shared():
+        """
+        Check if the Django cache is shared between processes, unlike the local memory and dummy caches.
+        """
+        return not isinstance(caches[DEFAULT_CACHE_ALIAS], (LocMemCache, DummyCache))
+
+    def acquire(self):
+        """
+        Wait until the rate limit allows a request, counted in the Django cache if it is shared between processes.
+        """
+        if self.is_cache_shared():
+            self.acquire_shared()
+        else:
+            self.acquire_local()
+
+    def acquire_local(self):
+        """
+        Take a token from the bucket, waiting for one to be refilled if the bucket is empty.
+
+        The token is reserved while holding the lock and the wait happens after releasing it, so the other threads
+        can reserve the following tokens meanwhile instead of queuing on the lock.
+        """
+        with self.lock:
+            now = monotonic()
+            self.tokens = min(self.rate, self.tokens + max(now - self.refilled_at, 0) * self.rate)
+            self.refilled_at = now
+            self.tokens -= 1
+            wait = -self.tokens / self.rate
+        if wait > 0:
+            sleep(wait)
+
+    def acquire_shared(self):
+        """
+        Count the request against the rate limit of the current second shared by all the processes.
+
+        If other processes have already used up the current second, wait until the next second starts and count the
+        request against that second instead.
+        """
+        while True:
+            now = time()
+            cache_key = get_cache_key(domain='taxonomy', subdomain='emsi_rate_limit', second=int(now))
+            cache.add(cache_key, 0, timeout=2)
+            try:
+                request_count = cache.incr(cache_key)
+            except ValueError:
+                # The counter was evicted right after being added, let the request through.
+                return
+            if request_count <= self.rate:
+                return
+            sleep(1 - now % 1)
+
+
+class KeepAliveHTTPAdapter(HTTPAdapter):
+    """
+    HTTP adapter that enables TCP keep-alive on its pooled connections.
+
+    Idle connections to LightCast are probed instead of being silently dropped by intermediate firewalls and load
+    balancers, so they can be reused without a new TCP and TLS handshake.
+    """
+    SOCKET_OPTIONS = HTTPConnection.default_socket_options + [(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)]
+    # Per connection keep-alive timings are not available on every platform.
+    if hasattr(socket, 'TCP_KEEPIDLE'):
+        SOCKET_OPTIONS += [
+            (socket.IPPROTO_TCP, socket.TCP_KEEPIDLE, 60),
+            (socket.IPPROTO_TCP, socket.TCP_KEEPINTVL, 10),
+        ]
+
+    def init_poolmanager(self, *args, **kwargs):
+        """
+        Initialize the pool manager with the keep-alive socket options.
+        """
+        kwargs['socket_options'] = self.SOCKET_OPTIONS
+        super().init_poolmanager(*args, **kwargs)
+
+
+def create_token_session():
+    """
+    Create the session used to fetch access tokens, shared by all the clients of a process.
+
+    Reusing its pooled keep-alive connections saves a TCP and TLS handshake with the authentication server on every
+    token refresh. Token requests are retried on gateway errors, the response of the last attempt is returned
+    so that `oauth_access_token` can log it.
+    """
+    session = requests.Session()
+    adapter = KeepAliveHTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=16,
+        max_retries=JitteredRetry(
+            total=3,
+            backoff_factor=0.2,
+            allowed_methods=frozenset({'POST'}),
+            status_forcelist=[502, 503, 504],
+            raise_on_status=False,
+        ),
+    )
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
+
+
 class JwtEMSIApiClient:
     """
     EMSI client authenticates using a access token for the given user.
     """
-    REQUEST_COUNT_CACHE = {}
+    RATE_LIMITER = RateLimiter(EMSI_API_RATE_LIMIT_PER_SEC)
+    CIRCUIT_BREAKERS = {}
+    TOKEN_SESSION = create_token_session()
+    SESSIONS = {}
 
-    ACCESS_TOKEN_URL = settings.EMSI_API_ACCESS_TOKEN_URL
-    API_BASE_URL = settings.EMSI_API_BASE_URL
+    ACCESS_TOKEN_URL = LazySetting('EMSI_API_ACCESS_TOKEN_URL')
+    API_BASE_URL = LazySetting('EMSI_API_BASE_URL')
     APPEND_SLASH = False
 
-    client_id = settings.EMSI_CLIENT_ID
-    client_secret = settings.EMSI_CLIENT_SECRET
+    client_id = LazySetting('EMSI_CLIENT_ID')
+    client_secret = LazySetting('EMSI_CLIENT_SECRET')
     ACCESS_TOKEN_EXPIRY_THRESHOLD = 60
+    ACCESS_TOKEN_LOCK_TIMEOUT = 10
+    ACCESS_TOKEN_LOCK_RETRIES = 20
+    CIRCUIT_BREAKER_FAILURE_THRESHOLD = LazySetting(
+        'EMSI_CIRCUIT_BREAKER_FAILURE_THRESHOLD', default=EMSI_CIRCUIT_BREAKER_FAILURE_THRESHOLD
+    )
+    CIRCUIT_BREAKER_COOLDOWN_SECONDS = LazySetting(
+        'EMSI_CIRCUIT_BREAKER_COOLDOWN_SECONDS', default=EMSI_CIRCUIT_BREAKER_COOLDOWN_SECONDS
+    )
 
     def __init__(self, scope):
         """
@@ -48,30 +314,66 @@ class JwtEMSIApiClient:
         self.scope = scope
         self.expires_at = 0
         self.client = None
+        self.connect_lock = threading.Lock()
+        self.token_request_bodies = {}
+
+    @property
+    def expires_at(self):
+        """
+        Return the wall clock time (in seconds since the epoch) at which the access token expires.
+        """
+        return self._expires_at
+
+    @expires_at.setter
+    def expires_at(self, value):
+        """
+        Set the expiry of the access token, along with the monotonic deadline used by `is_token_expired`.
+        """
+        self._expires_at = value
+        self._expires_monotonic = monotonic() + value - int(time()) - self.ACCESS_TOKEN_EXPIRY_THRESHOLD
 
     @classmethod
     def __ensure_request_allowed(cls):
         """
         Ensure the request to LightCast API is allowed.
 
-        This function will first check the total number of requests to the LightCast API in the current second,
-        - If the rate limit is reached then it will wait for 1 second and start the counter from 0.
-        - If the rate limit is not reached it will simply update the counter.
-        It also makes sure to clear the dict for the past (redundant) entries to avoid dict size from
-        increasing put of bound.
+        Requests from all the clients of the process share a single token bucket, so a request waits only for the
+        time left until the rate limit allows it instead of sleeping until the next second.
         """
-        # Wait for a second if limit for the current second is reached.
-        if cls.REQUEST_COUNT_CACHE.get(int(time()), 0) > EMSI_API_RATE_LIMIT_PER_SEC:
-            sleep(1)
+        cls.RATE_LIMITER.acquire()
 
-        second_count = int(time())
+    @staticmethod
+    def handle_circuit_breaking(func):
+        """
+        Fail fast while EMSI API is failing, see `CircuitBreaker`.
 
-        # If a second has passed then clear the dict and start counting from the start.
-        if second_count not in cls.REQUEST_COUNT_CACHE:
-            cls.REQUEST_COUNT_CACHE.clear()
-            cls.REQUEST_COUNT_CACHE[second_count] = 0
+        Client errors (4xx responses other than 429) are caused by the request rather than by EMSI API being down,
+        so they do not count as failures.
+        """
 
-        cls.REQUEST_COUNT_CACHE[second_count] += 1
+        @wraps(func)
+        def inner(self, *args, **kwargs):
+            """
+            Raise `TaxonomyAPIError` without calling the wrapped function if the circuit is open.
+            """
+            circuit_breaker = self.circuit_breaker
+            if not circuit_breaker.allow_request():
+                raise TaxonomyAPIError('EMSI API is unavailable, circuit breaker is open.')
+
+            try:
+                result = func(self, *args, **kwargs)
+            except TaxonomyAPIError as error:
+                response = getattr(error.__cause__, 'response', None)
+                # Note: responses with an error status are falsy.
+                status_code = response.status_code if isinstance(error.__cause__, HTTPError) and response is not None \
+                    else None
+                if status_code is None or status_code >= 500 or status_code == 429:
+                    circuit_breaker.record_failure()
+                raise
+            circuit_breaker.record_success()
+            return result
+
+        return inner
 
     @staticmethod
     def handle_rate_limiting(func):
@@ -99,19 +401,23 @@ class JwtEMSIApiClient:
         Arguments:
             grant_type (str): Grant type, usually `client_credentials`
         """
-        data = {
-            'grant_type': grant_type,
-            'client_id': self.client_id,
-            'client_secret': self.client_secret,
-            'scope': self.scope,
-        }
+        # The body only depends on the grant type, encode it once per client instead of on every request.
+        data = self.token_request_bodies.get(grant_type)
+        if data is None:
+            data = self.token_request_bodies[grant_type] = urlencode({
+                'grant_type': grant_type,
+                'client_id': self.client_id,
+                'client_secret': self.client_secret,
+                'scope': self.scope,
+            })
 
         # Make sure to avoid rate limit.
         self.__ensure_request_allowed()
-        response = requests.post(
+        response = self.TOKEN_SESSION.post(
             self.ACCESS_TOKEN_URL,
             data=data,
-            headers={'content-type': 'application/x-www-form-urlencoded'}
+            headers={'content-type': 'application/x-www-form-urlencoded'},
+            timeout=self.request_timeout,
         )
 
         if not response.ok:
@@ -122,32 +428,129 @@ class JwtEMSIApiClient:
             response.raise_for_status()
 
         LOGGER.info('[EMSI Service] Access token fetched successfully.')
-        data = response.json()
+        data = load_json(response)
         access_token = data['access_token']
         expires_in = data['expires_in']
         self.expires_at = int(time()) + expires_in
         return access_token
 
+    def get_access_token(self):
+        """
+        Get an access token for the scope of the client, shared with the other processes through the Django cache.
+
+        Only one process at a time fetches a new access token from EMSI API, the others wait briefly for it to be
+        cached instead of fetching their own.
+        """
+        cache_key = get_cache_key(
+            domain='taxonomy', subdomain='emsi_access_token', client_id=self.client_id, scope=self.scope
+        )
+        lock_key = f'{cache_key}.lock'
+        has_lock = False
+        for __ in range(self.ACCESS_TOKEN_LOCK_RETRIES):
+            cached_access_token = cache.get(cache_key)
+            if cached_access_token:
+                access_token, self.expires_at = cached_access_token
+                return access_token
+            if cache.add(lock_key, True, timeout=self.ACCESS_TOKEN_LOCK_TIMEOUT):
+                has_lock = True
+                break
+            sleep(self.ACCESS_TOKEN_LOCK_TIMEOUT / self.ACCESS_TOKEN_LOCK_RETRIES)
+        else:
+            # The process holding the lock may have cached the access token during the last wait.
+            cached_access_token = cache.get(cache_key)
+            if cached_access_token:
+                access_token, self.expires_at = cached_access_token
+                return access_token
+
+        try:
+            access_token = self.oauth_access_token()
+            timeout = self.expires_at - int(time()) - self.ACCESS_TOKEN_EXPIRY_THRESHOLD
+            if timeout > 0:
+                cache.set(cache_key, (access_token, self.expires_at), timeout=timeout)
+        finally:
+            # Only release the lock if it was acquired here, it belongs to another process otherwise.
+            if has_lock:
+                cache.delete(lock_key)
+        return access_token
+
+    @staticmethod
+    def create_session():
+        """
+        Create a session for the EMSI API with pooled keep-alive connections and retries.
+        """
+        session = requests.Session()
+        adapter = KeepAliveHTTPAdapter(
+            max_retries=JitteredRetry(
+                total=3,
+                backoff_factor=1,
+                allowed_methods=frozenset({'GET', 'POST'}),
+                status_forcelist=[429, 500, 502, 503, 504],
+                respect_retry_after_header=True,
+            )
+        )
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        return session
+
     def connect(self):
         """
         Connect to the REST API, authenticating with a JWT for the current user.
+
+        The session of each scope is shared by all the clients of the process and only its access token is replaced
+        on refresh, so the pooled connections to EMSI API are kept across token refreshes and client instances.
+        """
+        session = self.SESSIONS.get(self.scope)
+        if session is None:
+            session = self.SESSIONS.setdefault(self.scope, self.create_session())
+        session.auth = BearerAuth(self.get_access_token())
+        self.client = session
+
+    @property
+    def circuit_breaker(self):
+        """
+        Return the circuit breaker of the scope of the client.
+
+        Each scope has its own breaker, so that the skills API failing does not stop the requests to the job postings
+        API, and the other way around.
         """
-        self.client = requests.Session()
-        self.client.auth = BearerAuth(self.oauth_access_token())
-        adapter = HTTPAdapter(
-            max_retries=Retry(
-                total=3, backoff_factor=1, allowed_methods=None, status_forcelist=[429]
+        circuit_breaker = self.CIRCUIT_BREAKERS.get(self.scope)
+        if circuit_breaker is None:
+            circuit_breaker = self.CIRCUIT_BREAKERS.setdefault(
+                self.scope,
+                CircuitBreaker(self.CIRCUIT_BREAKER_FAILURE_THRESHOLD, self.CIRCUIT_BREAKER_COOLDOWN_SECONDS),
             )
+        return circuit_breaker
+
+    @property
+    def request_timeout(self):
+        """
+        Return the (connect, read) timeout of the requests to EMSI API, so that a stalled connection fails instead of
+        blocking the worker indefinitely.
+        """
+        return (
+            getattr(settings, 'EMSI_API_CONNECT_TIMEOUT', 3.05),
+            getattr(settings, 'EMSI_API_READ_TIMEOUT', 30),
+        )
+
+    def post_json(self, api_url, data, **kwargs):
+        """
+        Send a POST request with a JSON body to EMSI API.
+
+        The body is encoded with `orjson`, which is faster than the `json` module `requests` uses for `json=` bodies.
+        """
+        return self.client.post(
+            api_url,
+            data=orjson.dumps(data),
+            headers={'Content-Type': 'application/json'},
+            timeout=self.request_timeout,
+            **kwargs
         )
-        self.client.mount("http://", adapter)
-        self.client.mount("https://", adapter)
 
     def is_token_expired(self):
         """
         Return True if the access token has expired, False if not.
         """
-        expires_at = self.expires_at - self.ACCESS_TOKEN_EXPIRY_THRESHOLD
-        return int(time()) > expires_at
+        return monotonic() > self._expires_monotonic
 
     @staticmethod
     def refresh_token(func):
@@ -160,10 +563,40 @@ class JwtEMSIApiClient:
             Before calling the wrapped function, we check if the access token is expired, and if so, re-connect.
             """
             if self.is_token_expired():
-                self.connect()
+                # Only one of the threads sharing the client re-connects, the others wait and use its access token.
+                with self.connect_lock:
+                    if self.is_token_expired():
+                        self.connect()
             return func(self, *args, **kwargs)
         return inner
 
+    @staticmethod
+    def handle_api_errors(log_message, error_message):
+        """
+        Use this method decorator to turn the errors of the decorated EMSI API call into `TaxonomyAPIError`.
+
+        Arguments:
+            log_message (str): Message logged along with the exception, formatted with the decorated method's
+                arguments, e.g. `'Skill ID: [{skill_id}]'`.
+            error_message (str): Message of the raised `TaxonomyAPIError`, formatted the same way.
+        """
+        def decorator(func):
+            signature = inspect.signature(func)
+
+            @wraps(func)
+            def inner(self, *args, **kwargs):
+                """
+                Call the wrapped function, raising `TaxonomyAPIError` if the request to EMSI API fails.
+                """
+                try:
+                    return func(self, *args, **kwargs)
+                except (RequestException, ConnectionError, Timeout) as error:
+                    arguments = signature.bind(self, *args, **kwargs).arguments
+                    LOGGER.exception(log_message.format(**arguments))
+                    raise TaxonomyAPIError(error_message.format(**arguments)) from error
+            return inner
+        return decorator
+
     def get_api_url(self, path):
         """
         Construct the full API URL using the API_BASE_URL and path.
@@ -174,7 +607,7 @@ class JwtEMSIApiClient:
         if self.APPEND_SLASH:
             path += '/'
 
-        return urljoin(f"{self.API_BASE_URL}/", path)
+        return f"{self.API_BASE_URL.rstrip('/')}/{path}"
 
 
 class EMSISkillsApiClient(JwtEMSIApiClient):
@@ -182,8 +615,15 @@ class EMSISkillsApiClient(JwtEMSIApiClient):
     Object builds an API client to make calls to get the skills from course text data.
     """
 
-    API_BASE_URL = urljoin(JwtEMSIApiClient.API_BASE_URL, '/skills/versions/8.9')
+    API_BASE_URL = LazySetting('EMSI_API_BASE_URL', '/skills/versions/8.9')
     MAX_LIGHTCAST_DATA_SIZE = 50000  # Maximum 50,000-byte data is supported by LightCast
+    MIN_LIGHTCAST_TEXT_LENGTH = 1  # Blank texts are not worth a rate limited request, see `get_product_skills`
+    PRODUCT_SKILLS_CACHE_TIMEOUT = LazySetting(
+        'EMSI_SKILLS_CACHE_TTL', default=CACHE_TIMEOUT_EMSI_PRODUCT_SKILLS_SECONDS
+    )
+    # Requests for the skills of the same text in flight in the process, see `get_product_skills`.
+    IN_FLIGHT_PRODUCT_SKILLS = {}
+    IN_FLIGHT_PRODUCT_SKILLS_LOCK = threading.Lock()
 
     def __init__(self):
         """
@@ -191,11 +631,9 @@ class EMSISkillsApiClient(JwtEMSIApiClient):
         """
         super(EMSISkillsApiClient, self).__init__(scope='emsi_open')
 
-    @JwtEMSIApiClient.handle_rate_limiting
-    @JwtEMSIApiClient.refresh_token
     def get_skill_details(self, skill_id):
         """
-        Query the EMSI API to get details for a particular skill.
+        Get details for a particular skill, from the cache if they have been fetched from the EMSI API recently.
 
         We will be using this method to populate skill category and subcategory.
 
@@ -205,23 +643,52 @@ class EMSISkillsApiClient(JwtEMSIApiClient):
         Returns:
             (dict): A dictionary containing the skill details.
         """
-        try:
-            api_url = self.get_api_url(f'skills/{skill_id}')
-            response = self.client.get(api_url)
-            response.raise_for_status()
-            return response.json()
-        except (RequestException, ConnectionError, Timeout) as error:
-            LOGGER.exception(
-                '[TAXONOMY] Exception raised while fetching skill details from EMSI. Skill ID: [%s]',
-                skill_id
-            )
-            raise TaxonomyAPIError('Error while fetching skill details.') from error
+        # Skill details only change with the skills version, which is part of the API base URL.
+        cache_key = get_cache_key(
+            domain='taxonomy', subdomain='emsi_skill_details', api_base_url=self.API_BASE_URL, skill_id=skill_id
+        )
+        # The Django cache is used rather than TieredCache, whose request cache would keep every skill fetched by the
+        # threads of a management command in memory until the end of the command.
+        skill_details = cache.get(cache_key)
+        if skill_details is not None:
+            return skill_details
+
+        skill_details = self.fetch_skill_details(skill_id)
+        cache.set(cache_key, skill_details, timeout=CACHE_TIMEOUT_EMSI_SKILL_DETAILS_SECONDS)
+        return skill_details
 
+    @JwtEMSIApiClient.handle_circuit_breaking
     @JwtEMSIApiClient.handle_rate_limiting
     @JwtEMSIApiClient.refresh_token
+    @JwtEMSIApiClient.handle_api_errors(
+        '[TAXONOMY] Exception raised while fetching skill details from EMSI. Skill ID: [{skill_id}]',
+        'Error while fetching skill details.',
+    )
+    def fetch_skill_details(self, skill_id):
+        """
+        Query the EMSI API to get details for a particular skill.
+
+        Arguments:
+             skill_id (str): Skill external id, this is the id that comes from EMSI. example: 'KS124P772D5HNCJGGQ05'
+
+        Returns:
+            (dict): A dictionary containing the skill details.
+        """
+        response = self.client.get(self.get_api_url(f'skills/{skill_id}'), timeout=self.request_timeout)
+        response.raise_for_status()
+        return load_json(response)
+
     def get_product_skills(self, text_data):
         """
-        Query the EMSI API for the skills of the given product text data.
+        Get the skills of the given product text data.
+
+        Texts shorter than the `EMSI_MIN_TEXT_LENGTH` setting, not counting HTML markup, are not sent to the EMSI API,
+        LightCast does not extract any skills from them and the request would only use up the rate limit. By default
+        only blank texts are skipped, e.g. descriptions made of empty paragraphs.
+
+        Skills are cached by a hash of the text for the `EMSI_SKILLS_CACHE_TTL` setting, so that products
+        whose text did not change since the last refresh do not need a request.
+        Concurrent calls for the same text share a single request.
 
         Arguments:
             text_data (str): Product data as text, this is usually description in case of a course
@@ -230,43 +697,118 @@ class EMSISkillsApiClient(JwtEMSIApiClient):
         Returns:
             dict: A dictionary containing details of all the skills.
         """
+        min_text_length = getattr(settings, 'EMSI_MIN_TEXT_LENGTH', self.MIN_LIGHTCAST_TEXT_LENGTH)
+        # Only texts with markup need to be stripped, e.g. descriptions made of empty paragraphs.
+        if not text_data or len(text_data.strip()) < min_text_length or (
+            '<' in text_data and len(strip_tags(text_data).strip()) < min_text_length
+        ):
+            LOGGER.debug(
+                '[TAXONOMY] Skipped the skills extraction of a text shorter than %s characters: [%s]',
+                min_text_length,
+                text_data,
+            )
+            return {'data': []}
 
-        if text_data and len(text_data) > self.MAX_LIGHTCAST_DATA_SIZE:
+        if len(text_data) > self.MAX_LIGHTCAST_DATA_SIZE:
             # Truncate the text_data to 50,000 bytes since only 50,000-byte data is supported by LightCast
             text_data = text_data[:self.MAX_LIGHTCAST_DATA_SIZE]
 
-        data = {
-            'text': text_data
-        }
+        # The skills version is part of the API base URL, skills extracted by another version are not reused.
+        cache_key = get_cache_key(
+            domain='taxonomy',
+            subdomain='emsi_product_skills',
+            api_base_url=self.API_BASE_URL,
+            text_hash=hashlib.blake2b(text_data.encode('utf-8'), digest_size=16).hexdigest(),
+        )
+        product_skills = cache.get(cache_key)
+        if product_skills is not None:
+            return product_skills
+
+        # Threads asking for the skills of a text that is already being fetched wait for that request instead.
+        with self.IN_FLIGHT_PRODUCT_SKILLS_LOCK:
+            future = self.IN_FLIGHT_PRODUCT_SKILLS.get(cache_key)
+            is_fetching = future is None
+            if is_fetching:
+                future = self.IN_FLIGHT_PRODUCT_SKILLS[cache_key] = Future()
+        if not is_fetching:
+            return future.result()
+
         try:
-            api_url = self.get_api_url('extract')
-            response = self.client.post(
-                api_url,
-                json=data,
-            )
-            response.raise_for_status()
-            return self.traverse_skills_data(response.json())
-        except (RequestException, ConnectionError, Timeout) as error:
-            LOGGER.exception(
-                '[TAXONOMY] Exception raised while fetching skills data from EMSI. PostData: [%s]',
-                data
-            )
-            raise TaxonomyAPIError('Error while fetching product skills.') from error
+            product_skills = self.fetch_product_skills(text_data)
+            cache.set(cache_key, product_skills, self.PRODUCT_SKILLS_CACHE_TIMEOUT)
+            future.set_result(product_skills)
+            return product_skills
+        except BaseException as error:
+            # Also on interrupts and task timeouts, the waiting threads would block forever otherwise.
+            future.set_exception(error)
+            raise
+        finally:
+            with self.IN_FLIGHT_PRODUCT_SKILLS_LOCK:
+                del self.IN_FLIGHT_PRODUCT_SKILLS[cache_key]
+
+    @JwtEMSIApiClient.handle_circuit_breaking
+    @JwtEMSIApiClient.handle_rate_limiting
+    @JwtEMSIApiClient.refresh_token
+    @JwtEMSIApiClient.handle_api_errors(
+        '[TAXONOMY] Exception raised while fetching skills data from EMSI. Text data: [{text_data}]',
+        'Error while fetching product skills.',
+    )
+    def fetch_product_skills(self, text_data):
+        """
+        Query the EMSI API for the skills of the given product text data.
+
+        Arguments:
+            text_data (str): Product data as text, at most `MAX_LIGHTCAST_DATA_SIZE` long.
+
+        Returns:
+            dict: A dictionary containing details of all the skills.
+        """
+        response = self.post_json(self.get_api_url('extract'), {'text': text_data})
+        response.raise_for_status()
+        return self.traverse_skills_data(load_json(response))
+
+    def get_product_skills_bulk(self, text_data_list):
+        """
+        Query the EMSI API for the skills of several products concurrently.
+
+        LightCast extracts the skills of a single text per request, so the requests are sent from a pool of
+        `EMSI_API_RATE_LIMIT_PER_SEC` threads and the shared rate limiter keeps them within the rate limit.
+
+        Arguments:
+            text_data_list (list): Product data as text for each of the products.
+
+        Returns:
+            list: Skills data of each product in the order of `text_data_list`, with a `TaxonomyAPIError` in place
+                of the skills data of any product whose skills could not be fetched.
+        """
+        def get_skills(text_data):
+            try:
+                return self.get_product_skills(text_data)
+            except TaxonomyAPIError as error:
+                return error
+
+        with ThreadPoolExecutor(max_workers=EMSI_API_RATE_LIMIT_PER_SEC) as executor:
+            return list(executor.map(get_skills, text_data_list))
 
     @staticmethod
     def traverse_skills_data(response):
         """
         Transform data to a more useful format.
         """
+        skills_without_description = []
         for skill_details in response['data']:
             # append skill description in skill data extracted from "wikipediaExtract" tag
-            try:
-                desc = next(tag['value'] for tag in skill_details['skill']['tags'] if tag['key'] == 'wikipediaExtract')
-            except StopIteration:
-                LOGGER.warning('[TAXONOMY] "wikipediaExtract" key not found in skill: %s', skill_details['skill']['id'])
-                desc = ''
-            skill_details['skill']['description'] = desc
-
+            tags = {tag['key']: tag['value'] for tag in skill_details['skill']['tags']}
+            if 'wikipediaExtract' not in tags:
+                skills_without_description.append(skill_details['skill']['id'])
+            skill_details['skill']['description'] = tags.get('wikipediaExtract', '')
+
+        if skills_without_description:
+            LOGGER.warning(
+                '[TAXONOMY] "wikipediaExtract" key not found in %d skills: %s',
+                len(skills_without_description),
+                skills_without_description,
+            )
         return response
 
 
@@ -275,7 +817,7 @@ class EMSIJobsApiClient(JwtEMSIApiClient):
     Object builds an API client to make calls to get the Jobs.
     """
 
-    API_BASE_URL = urljoin(JwtEMSIApiClient.API_BASE_URL, '/jpa')
+    API_BASE_URL = LazySetting('EMSI_API_BASE_URL', '/jpa')
 
     def __init__(self):
         """
@@ -283,8 +825,13 @@ class EMSIJobsApiClient(JwtEMSIApiClient):
         """
         super(EMSIJobsApiClient, self).__init__(scope='postings:us')
 
+    @JwtEMSIApiClient.handle_circuit_breaking
     @JwtEMSIApiClient.handle_rate_limiting
     @JwtEMSIApiClient.refresh_token
+    @JwtEMSIApiClient.handle_api_errors(
+        '[TAXONOMY] Exception raised while fetching data from EMSI',
+        'Error while fetching lookup for {ranking_facet.value}',
+    )
     def get_details(self, ranking_facet, query_filter):
         """
         Query the EMSI API for the lookup of the pre-defined filter_query.
@@ -297,22 +844,19 @@ class EMSIJobsApiClient(JwtEMSIApiClient):
             dict: A dictionary containing all the details for given facet.
 
         """
-        try:
-            api_url = self.get_api_url(f'taxonomies/{ranking_facet.value}/lookup')
-            response = self.client.post(
-                api_url,
-                json=query_filter,
-            )
+        api_url = self.get_api_url(f'taxonomies/{ranking_facet.value}/lookup')
+        # Large responses are streamed and the connection is released back to the pool as soon as they are read.
+        with self.post_json(api_url, query_filter, stream=True) as response:
             response.raise_for_status()
-            return response.json()
-        except (RequestException, ConnectionError, Timeout) as error:
-            LOGGER.exception('[TAXONOMY] Exception raised while fetching data from EMSI')
-            raise TaxonomyAPIError(
-                'Error while fetching lookup for {ranking_facet}'.format(ranking_facet=ranking_facet.value)
-            ) from error
+            return load_json(response, stream=True)
 
+    @JwtEMSIApiClient.handle_circuit_breaking
     @JwtEMSIApiClient.handle_rate_limiting
     @JwtEMSIApiClient.refresh_token
+    @JwtEMSIApiClient.handle_api_errors(
+        '[TAXONOMY] Exception raised while fetching jobs data from EMSI',
+        'Error while fetching job rankings for {ranking_facet.value}/{nested_ranking_facet.value}.',
+    )
     def get_jobs(self, ranking_facet, nested_ranking_facet, query_filter):
         """
         Query the EMSI API for the jobs of the pre-defined filter_query.
@@ -326,32 +870,32 @@ class EMSIJobsApiClient(JwtEMSIApiClient):
         Returns:
             dict: A dictionary containing details of all the jobs.
         """
-        try:
-            api_url = self.get_api_url(f'rankings/{ranking_facet.value}/rankings/{nested_ranking_facet.value}')
-            response = self.client.post(
-                api_url,
-                json=query_filter,
-            )
+        api_url = self.get_api_url(f'rankings/{ranking_facet.value}/rankings/{nested_ranking_facet.value}')
+        with self.post_json(api_url, query_filter, stream=True) as response:
             response.raise_for_status()
-            return self.traverse_jobs_data(response.json())
-        except (RequestException, ConnectionError, Timeout) as error:
-            LOGGER.exception('[TAXONOMY] Exception raised while fetching jobs data from EMSI')
-            raise TaxonomyAPIError(
-                'Error while fetching job rankings for {ranking_facet}/{nested_ranking_facet}.'.format(
-                    ranking_facet=ranking_facet.value,
-                    nested_ranking_facet=nested_ranking_facet.value,
-                )
-            ) from error
+            return load_json(response, stream=True)
 
     @staticmethod
     def traverse_jobs_data(jobs_data):
         """
-        Transform data to a more useful format.
+        Return the data as is.
+
+        Deprecated: EMSI API responses are returned without this pass-through, it will be removed in a future release.
         """
+        warnings.warn(
+            'traverse_jobs_data is deprecated and will be removed in a future release.',
+            DeprecationWarning,
+            stacklevel=2,
+        )
         return jobs_data
 
+    @JwtEMSIApiClient.handle_circuit_breaking
     @JwtEMSIApiClient.handle_rate_limiting
     @JwtEMSIApiClient.refresh_token
+    @JwtEMSIApiClient.handle_api_errors(
+        '[TAXONOMY] Exception raised while fetching job posting data from EMSI',
+        'Error while fetching job postings data ranked by {ranking_facet.value}.',
+    )
     def get_job_postings(self, ranking_facet, query_filter):
         """
         Query the EMSI API for the job postings data of the pre-defined filter_query.
@@ -363,25 +907,21 @@ class EMSIJobsApiClient(JwtEMSIApiClient):
         Returns:
             dict: A dictionary containing job postings data.
         """
-        try:
-            api_url = self.get_api_url(f'rankings/{ranking_facet.value}')
-            response = self.client.post(
-                api_url,
-                json=query_filter,
-            )
+        api_url = self.get_api_url(f'rankings/{ranking_facet.value}')
+        with self.post_json(api_url, query_filter, stream=True) as response:
             response.raise_for_status()
-            return self.traverse_job_postings_data(response.json())
-        except (RequestException, ConnectionError, Timeout) as error:
-            LOGGER.exception('[TAXONOMY] Exception raised while fetching job posting data from EMSI')
-            raise TaxonomyAPIError(
-                'Error while fetching job postings data ranked by {ranking_facet}.'.format(
-                    ranking_facet=ranking_facet.value,
-                )
-            ) from error
+            return load_json(response, stream=True)
 
     @staticmethod
     def traverse_job_postings_data(data):
         """
-        Transform data to a more useful format.
+        Return the data as is.
+
+        Deprecated: EMSI API responses are returned without this pass-through, it will be removed in a future release.
         """
+        warnings.warn(
+            'traverse_job_postings_data is deprecated and will be removed in a future release.',
+            DeprecationWarning,
+            stacklevel=2,
+        )
         return data
@@ -2,6 +2,14 @@
 Module that contains utility methods and classes for parsing EMSI responses.
 """
 INVALID_NAMES = {'NULL', 'NONE', ''}
+_CASEFOLDED_INVALID_NAMES = frozenset(name.casefold() for name in INVALID_NAMES)
+
+
+def is_valid_name(name):
+    """
+    Return True if the given category or subcategory name is present and not one of `INVALID_NAMES`.
+    """
+    return name is not None and name.casefold() not in _CASEFOLDED_INVALID_NAMES
 
 
 class SkillDataParser:
@@ -30,10 +38,10 @@ class SkillDataParser:
         category = self.data.get('category')
         subcategory = self.data.get('subcategory')
 
-        if category is None or category.get('name') is None or category.get('name').upper() in INVALID_NAMES:
+        if category is None or not is_valid_name(category.get('name')):
             category = None
             subcategory = None  # We can not have a non-null subcategory with null category.
-        elif subcategory is None or subcategory.get('name') is None or subcategory.get('name').upper() in INVALID_NAMES:
+        elif subcategory is None or not is_valid_name(subcategory.get('name')):
             subcategory = None
 
         return {
@@ -22,10 +22,10 @@ class ExcludeSkillsForm(forms.Form):
         super().__init__(*args, **kwargs)
 
         self.fields['include_skills'] = forms.MultipleChoiceField(
-            choices=((skill.id, skill.name) for skill in excluded_job_skills),
+            choices=[(skill.id, skill.name) for skill in excluded_job_skills],
             required=False,
         )
         self.fields['exclude_skills'] = forms.MultipleChoiceField(
-            choices=((skill.id, skill.name) for skill in job_skills),
+            choices=[(skill.id, skill.name) for skill in job_skills],
             required=False,
         )
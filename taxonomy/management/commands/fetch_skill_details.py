@@ -3,16 +3,21 @@ Management command for fetching and populating skill details, specifically skill
 """
 
 import logging
+from concurrent.futures import ThreadPoolExecutor
 
 from edx_django_utils.db import chunked_queryset
 
 from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
 from django.db.models import Q
+from django.utils.timezone import now
 
+from taxonomy.constants import EMSI_API_RATE_LIMIT_PER_SEC
 from taxonomy.emsi.client import EMSISkillsApiClient
 from taxonomy.emsi.parsers.skill_parsers import SkillDataParser
 from taxonomy.exceptions import TaxonomyAPIError
-from taxonomy.models import Skill, SkillCategory, SkillSubCategory
+from taxonomy.models import JobSkills, Skill, SkillCategory, SkillSubCategory
+from taxonomy.utils import refresh_job_skill_category_rollups
 
 LOGGER = logging.getLogger(__name__)
 
@@ -27,49 +32,74 @@ class Command(BaseCommand):
         """
     help = 'Fetch and populate skill category and subcategory.'
 
-    def _update_skill_category_and_sub_category(self, skill, skill_data):
+    def _update_skill_categories_and_sub_categories(self, skills_data):
         """
-        Persist the skill category and subcategory data in the database.
+        Persist the skill categories and subcategories of a chunk of skills in the database.
+
+        The new categories and subcategories are inserted with a query each, existing ones are left as they are, and
+        the skills are updated with a single query. The skill category rollups of the jobs with these skills are
+        rebuilt afterwards, which also drops their cached top skill categories.
 
         Arguments:
-            skill (Skill): Skill instance whose category and subcategory needs to be added/updated.
-            skill_data (dict): A dictionary containing skill category and subcategory.
+            skills_data (list): Tuples of a Skill instance whose category and subcategory needs to be added/updated,
+                and a dictionary containing its skill category and subcategory.
         """
-        LOGGER.info('Updating category and subcategory data for skill external id {}.'.format(skill.external_id))
-        category = skill_data.get('category')
-        subcategory = skill_data.get('subcategory')
-        if category:
-            skill_category, _ = SkillCategory.objects.get_or_create(
-                id=category['id'],
-                defaults={'name': category['name']}
-            )
-            skill.category = skill_category
+        categories = {}
+        subcategories = {}
+        updated_skills = []
+        modified = now()
+        for skill, skill_data in skills_data:
+            LOGGER.info('Updating category and subcategory data for skill external id {}.'.format(skill.external_id))
+            category = skill_data.get('category')
+            subcategory = skill_data.get('subcategory')
+            if not category:
+                continue
 
+            categories.setdefault(category['id'], SkillCategory(id=category['id'], name=category['name']))
+            skill.category_id = category['id']
             if subcategory:
-                skill_subcategory, _ = SkillSubCategory.objects.get_or_create(
-                    id=subcategory['id'],
-                    defaults={'name': subcategory['name']},
-                    category=skill_category,
+                subcategories.setdefault(
+                    subcategory['id'],
+                    SkillSubCategory(id=subcategory['id'], name=subcategory['name'], category_id=category['id']),
                 )
-                skill.subcategory = skill_subcategory
+                skill.subcategory_id = subcategory['id']
+
+            skill.modified = modified
+            updated_skills.append(skill)
 
-            skill.save()
+        with transaction.atomic():
+            SkillCategory.objects.bulk_create(categories.values(), ignore_conflicts=True)
+            SkillSubCategory.objects.bulk_create(subcategories.values(), ignore_conflicts=True)
+            Skill.objects.bulk_update(updated_skills, ['category', 'subcategory', 'modified'])
+
+        if updated_skills:
+            # `bulk_update` sends no signals, the rollups of the jobs with these skills still use the old categories.
+            job_ids = JobSkills.objects.filter(skill__in=updated_skills).values_list('job_id', flat=True).distinct()
+            refresh_job_skill_category_rollups(job_ids=list(job_ids))
 
     def _fetch_skill_category_and_sub_category(self):
         """
         Fetch skill category and subcategory data from EMSI and update the database accordingly.
+
+        The skill details of each chunk are fetched concurrently, the shared rate limiter of the client keeps the
+        requests within the EMSI rate limit. The database is only updated from the main thread.
         """
         client = EMSISkillsApiClient()
         try:
-            skills = Skill.objects.filter(Q(category__isnull=True) | Q(subcategory__isnull=True))
-            for chunked_skills in chunked_queryset(skills, chunk_size=100):
-                for skill in chunked_skills:
-                    response = client.get_skill_details(skill_id=skill.external_id)
-                    skill_data_parser = SkillDataParser(response=response)
-                    self._update_skill_category_and_sub_category(
-                        skill=skill,
-                        skill_data=skill_data_parser.get_skill_category_data()
+            # Only the fields used by the command are loaded, skill descriptions can be long.
+            skills = Skill.objects.filter(Q(category__isnull=True) | Q(subcategory__isnull=True)).only(
+                'external_id', 'category', 'subcategory'
+            )
+            with ThreadPoolExecutor(max_workers=EMSI_API_RATE_LIMIT_PER_SEC) as executor:
+                for chunked_skills in chunked_queryset(skills, chunk_size=100):
+                    chunked_skills = list(chunked_skills)
+                    responses = executor.map(
+                        client.get_skill_details, [skill.external_id for skill in chunked_skills]
                     )
+                    self._update_skill_categories_and_sub_categories([
+                        (skill, SkillDataParser(response=response).get_skill_category_data())
+                        for skill, response in zip(chunked_skills, responses)
+                    ])
         except TaxonomyAPIError as error:
             message = 'Taxonomy API Error for refreshing the skill category and subcategory data for skill. ' \
                       'Error: {}'.format(error)
@@ -7,6 +7,10 @@ import logging
 
 from django.conf import settings
 from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import F, FloatField
+from django.db.models.functions import Cast, Coalesce
+from django.utils.timezone import now
 from django.utils.translation import gettext as _
 
 from taxonomy.exceptions import InvalidCommandOptionsError
@@ -62,14 +66,23 @@ class Command(BaseCommand):
         return value
 
     @staticmethod
-    def _is_over_threshold(actual_count, total_count, min_votes, ratio_threshold):
+    def _filter_over_threshold(xblock_skills, count_field, min_votes, ratio_threshold):
         """
-        Checks if count passes min count and ratio test.
+        Filters the xblockskill tags whose count passes min count and ratio test.
         """
-        has_min_votes = bool(actual_count > int(min_votes))
-        count_ratio = float(actual_count / total_count)
-        crosses_ratio_threshold = bool(count_ratio > float(ratio_threshold))
-        return has_min_votes and crosses_ratio_threshold
+        return xblock_skills.annotate(
+            votes=Coalesce(count_field, 0),
+            count_ratio=Cast(Coalesce(count_field, 0), FloatField()) / F('total_count'),
+        ).filter(votes__gt=int(min_votes), count_ratio__gt=float(ratio_threshold))
+
+    @staticmethod
+    def _update_xblock_skills(xblock_skills, log_message, **fields):
+        """
+        Updates the given xblockskill tags with a single query and logs each of them.
+        """
+        for skill_name, usage_key in xblock_skills.values_list('skill__name', 'xblock__usage_key').iterator():
+            LOGGER.info(log_message, skill_name, usage_key)
+        xblock_skills.update(modified=now(), **fields)
 
     def handle(self, *args, **options):
         """
@@ -98,27 +111,24 @@ class Command(BaseCommand):
             options,
         )
 
-        for xblock_skill in XBlockSkillData.objects.filter(
-                verified=False, is_blacklisted=False).iterator(chunk_size=2000):
-            verified_count = xblock_skill.verified_count if xblock_skill.verified_count else 0
-            ignored_count = xblock_skill.ignored_count if xblock_skill.ignored_count else 0
-            total_count = int(verified_count + ignored_count)
-            if total_count <= 0:
-                continue
-            if self._is_over_threshold(verified_count, total_count, min_verified_votes, ratio_verified_threshold):
-                xblock_skill.verified = True
-                xblock_skill.save()
-                LOGGER.info(
-                    '[%s] skill tag for the xblock [%s] has been verified',
-                    xblock_skill.skill.name,
-                    xblock_skill.xblock.usage_key
-                )
-            elif self._is_over_threshold(ignored_count, total_count, min_ignored_votes, ratio_ignored_threshold):
-                xblock_skill.is_blacklisted = True
-                xblock_skill.save()
-                LOGGER.info(
-                    '[%s] skill tag for the xblock [%s] has been blacklisted',
-                    xblock_skill.skill.name,
-                    xblock_skill.xblock.usage_key
-                )
+        # The thresholds are checked by the database, tags without any votes are skipped.
+        xblock_skills = XBlockSkillData.objects.filter(verified=False, is_blacklisted=False).annotate(
+            total_count=Coalesce('verified_count', 0) + Coalesce('ignored_count', 0),
+        ).filter(total_count__gt=0)
+        with transaction.atomic():
+            self._update_xblock_skills(
+                self._filter_over_threshold(
+                    xblock_skills, 'verified_count', min_verified_votes, ratio_verified_threshold
+                ),
+                '[%s] skill tag for the xblock [%s] has been verified',
+                verified=True,
+            )
+            # Tags verified above no longer match `verified=False`, so they are not blacklisted.
+            self._update_xblock_skills(
+                self._filter_over_threshold(
+                    xblock_skills, 'ignored_count', min_ignored_votes, ratio_ignored_threshold
+                ),
+                '[%s] skill tag for the xblock [%s] has been blacklisted',
+                is_blacklisted=True,
+            )
         LOGGER.info('Xblockskill tags verification task is completed')
@@ -8,6 +8,7 @@ from concurrent.futures import ThreadPoolExecutor
 
 from django.core.management.base import BaseCommand
 
+from taxonomy.constants import CHAT_COMPLETION_MAX_WORKERS
 from taxonomy.models import Job
 from taxonomy.utils import generate_and_store_job_description
 
@@ -29,7 +30,7 @@ class Command(BaseCommand):
         """
         LOGGER.info('Command started. Generating job descriptions for all jobs.')
 
-        with ThreadPoolExecutor(max_workers=40) as executor:
+        with ThreadPoolExecutor(max_workers=CHAT_COMPLETION_MAX_WORKERS) as executor:
             for job in Job.objects.exclude(name__isnull=True).filter(description=''):
                 executor.submit(generate_and_store_job_description, job.external_id, job.name)
 
@@ -83,7 +83,9 @@ class Command(BaseCommand):
         if options['all']:
             courses = get_course_metadata_provider().get_all_courses()
         elif options['course']:
-            courses = get_course_metadata_provider().get_courses(course_ids=options['course'])
+            # Drop repeated course ids so that the provider can skip de-duplicating its results.
+            course_ids = list(dict.fromkeys(options['course']))
+            courses = get_course_metadata_provider().get_courses(course_ids=course_ids)
             if not courses:
                 raise CourseMetadataNotFoundError(
                     'No course metadata was found for following courses. {}'.format(options['course'])
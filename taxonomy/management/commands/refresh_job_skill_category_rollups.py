@@ -0,0 +1,33 @@
+"""
+Management command for rebuilding the per skill category totals of the job skills.
+"""
+
+import logging
+
+from django.core.management.base import BaseCommand
+
+from taxonomy.utils import refresh_job_skill_category_rollups
+
+LOGGER = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    """
+    Command for rebuilding the `JobSkillCategoryRollup` records of all the jobs.
+
+    Rollups are rebuilt for a single job whenever its job skills change, this command rebuilds them for all the jobs
+    and should be run periodically to pick up skills that moved to a different category.
+
+    Example usage:
+        $ # Rebuild the skill category rollups of all the jobs.
+        $ ./manage.py refresh_job_skill_category_rollups
+    """
+    help = 'Rebuilds the skill category rollups of all the jobs.'
+
+    def handle(self, *args, **options):
+        """
+        Entry point for management command execution.
+        """
+        LOGGER.info('[TAXONOMY] Refresh job skill category rollups process started.')
+        refresh_job_skill_category_rollups()
+        LOGGER.info('[TAXONOMY] Refresh job skill category rollups process finished successfully.')
@@ -13,6 +13,7 @@ from taxonomy.emsi.client import EMSIJobsApiClient
 from taxonomy.enums import RankingFacet
 from taxonomy.exceptions import TaxonomyAPIError
 from taxonomy.models import Industry, IndustryJobSkill, Job, JobSkills, Skill
+from taxonomy.utils import deferred_job_skill_category_rollups
 
 LOGGER = logging.getLogger(__name__)
 
@@ -110,4 +111,6 @@ class Command(BaseCommand):
         """
         Entry point for management command execution.
         """
-        self._refresh_job_skills(RankingFacet.TITLE, RankingFacet.SKILLS)
+        # The skill category rollups of each job are rebuilt once, after all of its job skills have been saved.
+        with deferred_job_skill_category_rollups():
+            self._refresh_job_skills(RankingFacet.TITLE, RankingFacet.SKILLS)
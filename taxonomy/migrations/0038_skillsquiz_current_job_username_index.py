@@ -0,0 +1,17 @@
+# Generated by Django 5.2.18 on 2026-10-17 05:50
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('taxonomy', '0037_alter_xblockskilldata_is_blacklisted_and_more'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='skillsquiz',
+            index=models.Index(fields=['current_job', 'username'], name='taxonomy_sk_current_590fbf_idx'),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 5.2.18 on 2026-10-17 05:51
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('taxonomy', '0038_skillsquiz_current_job_username_index'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='jobskills',
+            index=models.Index(fields=['job', 'skill', 'significance', 'unique_postings'], name='taxonomy_jo_job_id_1ccd45_idx'),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 5.2.18 on 2026-10-17 05:56
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('taxonomy', '0039_jobskills_covering_index'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='courseskills',
+            index=models.Index(fields=['skill', 'is_blacklisted'], name='taxonomy_co_skill_i_75b6b1_idx'),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-17 06:06
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('taxonomy', '0040_courseskills_skill_is_blacklisted_index'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='skillsquiz',
+            name='username',
+            field=models.CharField(db_index=True, max_length=150, verbose_name='username'),
+        ),
+    ]
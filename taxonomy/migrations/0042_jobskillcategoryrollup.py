@@ -0,0 +1,71 @@
+# Generated by Django 5.2.18 on 2026-10-17 06:08
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.db import migrations, models
+
+import model_utils.fields
+
+
+def add_job_skill_category_rollups(apps, schema_editor):
+    """
+    Build the skill category rollups of the existing job skills, the same way as `refresh_job_skill_category_rollups`.
+    """
+    JobSkills = apps.get_model('taxonomy', 'JobSkills')
+    JobSkillCategoryRollup = apps.get_model('taxonomy', 'JobSkillCategoryRollup')
+    category_totals = JobSkills.objects.filter(
+        skill__category__isnull=False
+    ).order_by().values('job_id', 'skill__category_id').annotate(
+        total_significance=models.Sum('significance'),
+        total_unique_postings=models.Sum('unique_postings'),
+        total_skills=models.Count('id'),
+    )
+    JobSkillCategoryRollup.objects.bulk_create(
+        [
+            JobSkillCategoryRollup(
+                job_id=category_total['job_id'],
+                category_id=category_total['skill__category_id'],
+                total_significance=category_total['total_significance'],
+                total_unique_postings=category_total['total_unique_postings'],
+                total_skills=category_total['total_skills'],
+            )
+            for category_total in category_totals.iterator()
+        ],
+        batch_size=1000,
+    )
+
+
+def do_nothing(apps, schema_editor):
+    """
+    Do nothing, the rollups are dropped along with their table.
+    """
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('taxonomy', '0041_skillsquiz_username_index'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='JobSkillCategoryRollup',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created', model_utils.fields.AutoCreatedField(default=django.utils.timezone.now, editable=False, verbose_name='created')),
+                ('modified', model_utils.fields.AutoLastModifiedField(default=django.utils.timezone.now, editable=False, verbose_name='modified')),
+                ('total_significance', models.FloatField(help_text='Sum of the significance of the job skills in this category.')),
+                ('total_unique_postings', models.FloatField(help_text='Sum of the unique postings of the job skills in this category.')),
+                ('total_skills', models.PositiveIntegerField(help_text='Number of the job skills in this category.')),
+                ('category', models.ForeignKey(help_text='The category of the summarized skills.', on_delete=django.db.models.deletion.CASCADE, to='taxonomy.skillcategory')),
+                ('job', models.ForeignKey(help_text='The job whose skills are summarized.', on_delete=django.db.models.deletion.CASCADE, to='taxonomy.job')),
+            ],
+            options={
+                'verbose_name': 'Job Skill Category Rollup',
+                'verbose_name_plural': 'Job Skill Category Rollups',
+                'indexes': [models.Index(fields=['job', '-total_significance'], name='taxonomy_jo_job_id_580fc4_idx')],
+                'unique_together': {('job', 'category')},
+            },
+        ),
+        migrations.RunPython(add_job_skill_category_rollups, do_nothing),
+    ]
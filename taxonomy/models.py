@@ -7,6 +7,7 @@ from __future__ import unicode_literals
 import logging
 import uuid
 
+from edx_django_utils.cache import TieredCache, get_cache_key
 from opaque_keys import InvalidKeyError
 from opaque_keys.edx.keys import CourseKey
 from solo.models import SingletonModel
@@ -19,6 +20,7 @@ from django.utils.translation import gettext_lazy as _
 from model_utils.models import TimeStampedModel
 
 from taxonomy.choices import UserGoal
+from taxonomy.constants import CACHE_TIMEOUT_SKILL_VALIDATION_SECONDS
 from taxonomy.providers.utils import get_course_metadata_provider
 
 LOGGER = logging.getLogger(__name__)
@@ -110,6 +112,32 @@ class Skill(TimeStampedModel):
         ordering = ('created', )
         app_label = 'taxonomy'
 
+    # Category the skill was loaded or last saved with, see `has_category_changed`.
+    _stored_category_id = models.DEFERRED
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        """
+        Remember the stored category of the skill, so that saving a change of category can be detected.
+        """
+        instance = super().from_db(db, field_names, values)
+        if 'category_id' in field_names:
+            instance._stored_category_id = values[field_names.index('category_id')]
+        return instance
+
+    def save(self, *args, **kwargs):
+        """
+        Override to remember the category the skill is saved with.
+        """
+        super().save(*args, **kwargs)
+        self._stored_category_id = self.category_id
+
+    def has_category_changed(self):
+        """
+        Check if the category of the skill differs from the one it was loaded or last saved with.
+        """
+        return self._stored_category_id is not models.DEFERRED and self.category_id != self._stored_category_id
+
 
 class CourseRunXBlockSkillsTracker(TimeStampedModel):
     """
@@ -313,6 +341,9 @@ class CourseSkills(TimeStampedModel):
         ordering = ('created', )
         app_label = 'taxonomy'
         unique_together = ('course_key', 'skill')
+        indexes = [
+            models.Index(fields=['skill', 'is_blacklisted']),
+        ]
 
     def __str__(self):
         """
@@ -730,6 +761,10 @@ class JobSkills(BaseJobSkill):
         ordering = ('created',)
         app_label = 'taxonomy'
         unique_together = ('job', 'skill')
+        indexes = [
+            # Covering index for aggregating significance and unique postings of a job's skills.
+            models.Index(fields=['job', 'skill', 'significance', 'unique_postings']),
+        ]
 
     def __str__(self):
         """
@@ -791,6 +826,75 @@ class IndustryJobSkill(BaseJobSkill):
         )
 
 
+class JobSkillCategoryRollup(TimeStampedModel):
+    """
+    Summary of a job's skills per skill category.
+
+    The totals are derived from `JobSkills` and kept up to date by `refresh_job_skill_category_rollups`.
+
+    .. no_pii:
+    """
+
+    job = models.ForeignKey(
+        Job,
+        on_delete=models.CASCADE,
+        help_text=_(
+            'The job whose skills are summarized.'
+        )
+    )
+    category = models.ForeignKey(
+        'SkillCategory',
+        on_delete=models.CASCADE,
+        help_text=_(
+            'The category of the summarized skills.'
+        )
+    )
+    total_significance = models.FloatField(
+        help_text=_(
+            'Sum of the significance of the job skills in this category.'
+        )
+    )
+    total_unique_postings = models.FloatField(
+        help_text=_(
+            'Sum of the unique postings of the job skills in this category.'
+        )
+    )
+    total_skills = models.PositiveIntegerField(
+        help_text=_(
+            'Number of the job skills in this category.'
+        )
+    )
+
+    class Meta:
+        """
+        Metadata for the JobSkillCategoryRollup model.
+        """
+
+        verbose_name = 'Job Skill Category Rollup'
+        verbose_name_plural = 'Job Skill Category Rollups'
+        app_label = 'taxonomy'
+        unique_together = ('job', 'category')
+        indexes = [
+            models.Index(fields=['job', '-total_significance']),
+        ]
+
+    def __str__(self):
+        """
+        Create a human-readable string representation of the object.
+        """
+        return '<JobSkillCategoryRollup job_id="{}" category_id="{}" total_significance="{}">'.format(
+            self.job_id, self.category_id, self.total_significance
+        )
+
+    def __repr__(self):
+        """
+        Create a unique string representation of the object.
+        """
+        return '<JobSkillCategoryRollup id={} job_id="{}" category_id="{}" total_significance="{}">'.format(
+            self.id, self.job_id, self.category_id, self.total_significance
+        )
+
+
 class JobPostings(TimeStampedModel):
     """
     Postings for a job.
@@ -1053,7 +1157,7 @@ class SkillsQuiz(TimeStampedModel):
     .. no_pii:
     """
 
-    username = models.CharField(_("username"), max_length=150)
+    username = models.CharField(_("username"), max_length=150, db_index=True)
     skills = models.ManyToManyField(Skill, null=True, blank=True)
     current_job = models.ForeignKey(
         Job, on_delete=models.SET_NULL, related_name='current_job_skills_quiz', null=True, blank=True
@@ -1082,6 +1186,9 @@ class SkillsQuiz(TimeStampedModel):
         app_label = 'taxonomy'
         verbose_name = 'Skill Quiz'
         verbose_name_plural = 'Skill Quizzes'
+        indexes = [
+            models.Index(fields=['current_job', 'username']),
+        ]
 
 
 class Industry(models.Model):
@@ -1241,9 +1348,17 @@ class SkillValidationConfiguration(TimeStampedModel):
             raise ValidationError({'__all__': 'Add either course key or organization.'}) from ex
 
     def save(self, *args, **kwargs):
-        """Override to ensure that custom validation is always called."""
+        """
+        Override to ensure that custom validation is always called.
+
+        The cached `is_disabled` results of the previous organization or course key of an edited configuration are
+        invalidated too, those of the current ones are invalidated by the post_save signal handler.
+        """
         self.full_clean()
-        return super().save(*args, **kwargs)
+        previous = SkillValidationConfiguration.objects.filter(pk=self.pk).first() if self.pk else None
+        super().save(*args, **kwargs)
+        if previous:
+            previous.invalidate_is_disabled_cache()
 
     @staticmethod
     def is_valid_course_run_key(course_run_key):
@@ -1265,6 +1380,10 @@ class SkillValidationConfiguration(TimeStampedModel):
         """
         Check if skill validation is disabled for the given course run key.
 
+        The results are cached for a short duration so that repeated lookups for the same course run
+        do not hit the database and the course metadata provider on every request. The results are cached
+        per organization and per course, so that saving or deleting a configuration can invalidate them.
+
         Arguments:
             course_run_key (str): Course run key
 
@@ -1275,11 +1394,50 @@ class SkillValidationConfiguration(TimeStampedModel):
         if not is_valid_course_run_key:
             return False
 
-        if cls.objects.filter(organization=course_run_locator.org).exists():
+        if cls._is_disabled_for(organization=course_run_locator.org):
             return True
 
-        course_key = get_course_metadata_provider().get_course_key(course_run_key)
-        if course_key and cls.objects.filter(course_key=course_key).exists():
-            return True
+        cache_key = get_cache_key(domain='taxonomy', subdomain='course_run_course_key', course_run_key=course_run_key)
+        cached_response = TieredCache.get_cached_response(cache_key)
+        if cached_response.is_found:
+            course_key = cached_response.value
+        else:
+            course_key = get_course_metadata_provider().get_course_key(course_run_key)
+            TieredCache.set_all_tiers(cache_key, course_key, CACHE_TIMEOUT_SKILL_VALIDATION_SECONDS)
+
+        return bool(course_key) and cls._is_disabled_for(course_key=course_key)
+
+    @classmethod
+    def _is_disabled_for(cls, **lookup):
+        """
+        Check if skill validation is disabled for the given organization or course key, caching the result.
+        """
+        cache_key = cls.get_is_disabled_cache_key(**lookup)
+        cached_response = TieredCache.get_cached_response(cache_key)
+        if cached_response.is_found:
+            return cached_response.value
 
-        return False
+        is_disabled = cls.objects.filter(**lookup).exists()
+        TieredCache.set_all_tiers(cache_key, is_disabled, CACHE_TIMEOUT_SKILL_VALIDATION_SECONDS)
+        return is_disabled
+
+    @staticmethod
+    def get_is_disabled_cache_key(organization=None, course_key=None):
+        """
+        Get the cache key of the `is_disabled` result for the given organization or course key.
+        """
+        return get_cache_key(
+            domain='taxonomy',
+            subdomain='skill_validation_disabled',
+            organization=organization,
+            course_key=course_key,
+        )
+
+    def invalidate_is_disabled_cache(self):
+        """
+        Invalidate the cached `is_disabled` results affected by this configuration.
+        """
+        if self.organization:
+            TieredCache.delete_all_tiers(self.get_is_disabled_cache_key(organization=self.organization))
+        if self.course_key:
+            TieredCache.delete_all_tiers(self.get_is_disabled_cache_key(course_key=self.course_key))
@@ -3,11 +3,20 @@ import json
 import logging
 
 import requests
+from requests.adapters import HTTPAdapter
 
 from django.conf import settings
 
+from taxonomy.constants import CHAT_COMPLETION_MAX_WORKERS
+
 log = logging.getLogger(__name__)
 
+# Shared by all the threads of a process, so that chat completions reuse pooled keep-alive connections instead of
+# making a new TCP and TLS handshake for every prompt.
+SESSION = requests.Session()
+SESSION.mount('http://', HTTPAdapter(pool_maxsize=CHAT_COMPLETION_MAX_WORKERS))
+SESSION.mount('https://', HTTPAdapter(pool_maxsize=CHAT_COMPLETION_MAX_WORKERS))
+
 
 def chat_completion(prompt):
     """
@@ -21,7 +30,7 @@ def chat_completion(prompt):
     connect_timeout = getattr(settings, 'CHAT_COMPLETION_API_CONNECT_TIMEOUT', 1)
     read_timeout = getattr(settings, 'CHAT_COMPLETION_API_READ_TIMEOUT', 15)
     body = {'message_list': [{'role': 'assistant', 'content': prompt},]}
-    response = requests.post(
+    response = SESSION.post(
         completion_endpoint,
         headers=headers,
         data=json.dumps(body),
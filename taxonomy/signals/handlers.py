@@ -9,10 +9,10 @@ from openedx_events.content_authoring.signals import XBLOCK_DELETED, XBLOCK_DUPL
 from openedx_events.learning.data import XBlockSkillVerificationData
 from openedx_events.learning.signals import XBLOCK_SKILL_VERIFIED
 
-from django.db.models.signals import post_save
+from django.db.models.signals import post_delete, post_save
 from django.dispatch import receiver
 
-from taxonomy.models import Job
+from taxonomy.models import Job, JobSkills, Skill, SkillValidationConfiguration
 from taxonomy.tasks import (
     delete_xblock_skills,
     duplicate_xblock_skills,
@@ -22,6 +22,7 @@ from taxonomy.tasks import (
     update_xblock_skills,
     update_xblock_skills_verification_counts,
 )
+from taxonomy.utils import refresh_job_skill_category_rollups, refresh_job_skill_category_rollups_for_job
 
 from .signals import UPDATE_COURSE_SKILLS, UPDATE_PROGRAM_SKILLS, UPDATE_XBLOCK_SKILLS
 
@@ -123,3 +124,40 @@ def handle_generate_job_description(sender, instance, created, **kwargs):  # pyl
     # Trigger celery task only if job name exists and description is missing
     if instance.name and not instance.description:
         generate_job_description.delay(instance.external_id, instance.name)
+
+
+@receiver(post_save, sender=JobSkills)
+@receiver(post_delete, sender=JobSkills)
+def handle_job_skills_change(sender, instance, **kwargs):  # pylint: disable=unused-argument
+    """
+    Handler for post_save and post_delete signals for JobSkills model.
+
+    Rebuild the skill category rollups of the job, which also invalidates its cached top skill categories.
+
+    Inside `deferred_job_skill_category_rollups` the rollups are rebuilt once for all the saved job skills instead.
+    """
+    refresh_job_skill_category_rollups_for_job(instance.job_id)
+
+
+@receiver(post_save, sender=Skill)
+def handle_skill_category_change(sender, instance, created, **kwargs):  # pylint: disable=unused-argument
+    """
+    Handler for post_save signal for Skill model.
+
+    Rebuild the skill category rollups of the jobs with the skill when its category changed, e.g. in the admin.
+    """
+    if created or not instance.has_category_changed():
+        return
+    job_ids = JobSkills.objects.filter(skill=instance).values_list('job_id', flat=True).distinct()
+    refresh_job_skill_category_rollups(job_ids=list(job_ids))
+
+
+@receiver(post_save, sender=SkillValidationConfiguration)
+@receiver(post_delete, sender=SkillValidationConfiguration)
+def handle_skill_validation_configuration_change(sender, instance, **kwargs):  # pylint: disable=unused-argument
+    """
+    Handler for post_save and post_delete signals for SkillValidationConfiguration model.
+
+    Invalidate the cached `is_disabled` results, so that the change applies right away.
+    """
+    instance.invalidate_is_disabled_cache()
@@ -2,7 +2,10 @@
 Utils for taxonomy.
 """
 import logging
+import threading
+from contextlib import contextmanager
 from typing import List, Tuple, Union
+from uuid import uuid4
 
 import boto3
 from bs4 import BeautifulSoup
@@ -10,19 +13,28 @@ from edx_django_utils.cache import TieredCache, get_cache_key
 from edx_django_utils.cache.utils import hashlib
 
 from django.conf import settings
+from django.core.cache import cache
 from django.core.exceptions import ObjectDoesNotExist
 from django.db import transaction
-from django.db.models import F
+from django.db.models import Count, F, Sum
 from django.utils.timezone import now
 
 from taxonomy.choices import ProductTypes
-from taxonomy.constants import AMAZON_TRANSLATION_ALLOWED_SIZE, AUTO, ENGLISH, REGION, TRANSLATE_SERVICE
+from taxonomy.constants import (
+    AMAZON_TRANSLATION_ALLOWED_SIZE,
+    AUTO,
+    EMSI_PRODUCT_SKILLS_BATCH_SIZE,
+    ENGLISH,
+    REGION,
+    TRANSLATE_SERVICE,
+)
 from taxonomy.emsi.client import EMSISkillsApiClient
 from taxonomy.exceptions import SkipProductProcessingError, TaxonomyAPIError
 from taxonomy.models import (
     CourseSkills,
     Job,
     JobPath,
+    JobSkillCategoryRollup,
     JobSkills,
     ProgramSkill,
     Skill,
@@ -38,6 +50,13 @@ CACHE_TIMEOUT_COURSE_SKILLS_SECONDS = 60 * 60
 
 COURSE_METADATA_FIELDS_COMBINED = 'title:short_description:full_description'
 
+JOB_TOP_SKILL_CATEGORIES_CACHE_VERSION_KEY = get_cache_key(
+    domain='taxonomy', subdomain='job_top_skill_categories_version'
+)
+
+# Jobs whose skill category rollups are waiting to be rebuilt, see `deferred_job_skill_category_rollups`.
+_DEFERRED_ROLLUPS = threading.local()
+
 
 def get_whitelisted_serialized_skills(key_or_uuid, product_type=ProductTypes.Course):
     """
@@ -76,6 +95,100 @@ def get_whitelisted_serialized_skills(key_or_uuid, product_type=ProductTypes.Cou
     return skills_data
 
 
+def get_job_top_skill_categories_cache_key(job_id):
+    """
+    Get the cache key of the top skill categories response for the given job.
+
+    The key includes a version, which is replaced to invalidate the cached responses of all the jobs at once.
+
+    Arguments:
+        job_id (int): Primary key of the job.
+    """
+    version = cache.get_or_set(JOB_TOP_SKILL_CATEGORIES_CACHE_VERSION_KEY, lambda: uuid4().hex, timeout=None)
+    return get_cache_key(
+        domain='taxonomy', subdomain='job_top_skill_categories', job_id=int(job_id), version=version
+    )
+
+
+@contextmanager
+def deferred_job_skill_category_rollups():
+    """
+    Rebuild the skill category rollups of the jobs whose skills change inside the block once, when it exits.
+
+    Job skills are saved one at a time, without this every saved job skill would rebuild all the rollups of its job.
+    """
+    if getattr(_DEFERRED_ROLLUPS, 'job_ids', None) is not None:
+        # Nested blocks are rebuilt by the outermost one.
+        yield
+        return
+
+    _DEFERRED_ROLLUPS.job_ids = set()
+    try:
+        yield
+    finally:
+        job_ids, _DEFERRED_ROLLUPS.job_ids = _DEFERRED_ROLLUPS.job_ids, None
+        if job_ids:
+            refresh_job_skill_category_rollups(job_ids=sorted(job_ids))
+
+
+def refresh_job_skill_category_rollups_for_job(job_id):
+    """
+    Rebuild the skill category rollups of the given job, or defer it inside `deferred_job_skill_category_rollups`.
+
+    Arguments:
+        job_id (int): Primary key of the job whose skills changed.
+    """
+    job_ids = getattr(_DEFERRED_ROLLUPS, 'job_ids', None)
+    if job_ids is None:
+        refresh_job_skill_category_rollups(job_ids=[job_id])
+    else:
+        job_ids.add(job_id)
+
+
+def refresh_job_skill_category_rollups(job_ids=None):
+    """
+    Rebuild the per skill category totals of the job skills.
+
+    The cached top skill categories of the rebuilt jobs are invalidated as well, so that every path rebuilding the
+    rollups also drops the responses computed from the previous ones.
+
+    Arguments:
+        job_ids (list): Primary keys of the jobs whose rollups should be rebuilt, all the jobs are rebuilt if `None`.
+    """
+    job_skills = JobSkills.objects.filter(skill__category__isnull=False)
+    rollups = JobSkillCategoryRollup.objects.all()
+    if job_ids is not None:
+        job_skills = job_skills.filter(job_id__in=job_ids)
+        rollups = rollups.filter(job_id__in=job_ids)
+
+    category_totals = job_skills.order_by().values('job_id', 'skill__category_id').annotate(
+        total_significance=Sum('significance'),
+        total_unique_postings=Sum('unique_postings'),
+        total_skills=Count('id'),
+    )
+    with transaction.atomic():
+        rollups.delete()
+        JobSkillCategoryRollup.objects.bulk_create(
+            [
+                JobSkillCategoryRollup(
+                    job_id=category_total['job_id'],
+                    category_id=category_total['skill__category_id'],
+                    total_significance=category_total['total_significance'],
+                    total_unique_postings=category_total['total_unique_postings'],
+                    total_skills=category_total['total_skills'],
+                )
+                for category_total in category_totals.iterator()
+            ],
+            batch_size=1000,
+        )
+
+    if job_ids is None:
+        cache.set(JOB_TOP_SKILL_CATEGORIES_CACHE_VERSION_KEY, uuid4().hex, timeout=None)
+        return
+    for job_id in job_ids:
+        TieredCache.delete_all_tiers(get_job_top_skill_categories_cache_key(job_id))
+
+
 def get_product_identifier(product_type):
     """
     Return the identifier of a Product Model from Discovery.
@@ -296,10 +409,61 @@ def get_skill_attr_value(product, product_type, skill_extraction_attr):
     return skill_attr_val
 
 
+def _process_product_skills_batch(client, batch, should_commit_to_db, product_type, key_or_uuid):
+    """
+    Fetch the skills of the batched products from EMSI API and insert them into db.
+
+    Args:
+        client (EMSISkillsApiClient): Client used to fetch the skills of the products.
+        batch (list): List of `(product, translated_skill_attr, extra_data)` tuples.
+        should_commit_to_db (bool): Flag to store skills to database.
+        product_type (ProductTypes): Any one choice from ProductTypes
+        key_or_uuid (str): Name of the product identifier field.
+
+    Returns:
+        Tuple of success_count and list of failures.
+    """
+    success_count = 0
+    all_failures = []
+    products_skills = client.get_product_skills_bulk(
+        [translated_skill_attr for __, translated_skill_attr, __ in batch]
+    )
+    for (product, __, extra_data), skills in zip(batch, products_skills):
+        if isinstance(skills, TaxonomyAPIError):
+            message = f'[TAXONOMY] API Error for key: {product[key_or_uuid]}'
+            LOGGER.error(message)
+            all_failures.append((product[key_or_uuid], message))
+            continue
+
+        # Process the skills from external API and insert it into db.
+        try:
+            failures = process_skills_data(
+                product,
+                skills,
+                should_commit_to_db,
+                product_type,
+                **extra_data
+            )
+            if failures:
+                LOGGER.info('[TAXONOMY] Skills data received from EMSI. Skills: [%s]', skills)
+                all_failures += failures
+            else:
+                success_count += 1
+        except Exception as ex:  # pylint: disable=broad-except
+            LOGGER.info('[TAXONOMY] Skills data received from EMSI. Skills: [%s]', skills)
+            message = f'[TAXONOMY] Exception for key: {product[key_or_uuid]} Error: {ex}'
+            LOGGER.error(message)
+            all_failures.append((product[key_or_uuid], message))
+    return success_count, all_failures
+
+
 def refresh_product_skills(products, should_commit_to_db: bool, product_type) -> Tuple[int, int]:
     """
     Refresh the skills associated with the provided products.
 
+    Skills are fetched from EMSI API concurrently for batches of `EMSI_PRODUCT_SKILLS_BATCH_SIZE` products, except
+    for xblocks which may reuse the skills of a previously processed xblock with the same content.
+
     Args:
         products (list or iterator of products): Products can include courses, programs or xblocks.
         should_commit_to_db (bool): Flag to store skills to database.
@@ -312,6 +476,8 @@ def refresh_product_skills(products, should_commit_to_db: bool, product_type) ->
     success_count = 0
     skipped_count = 0
     skill_extraction_attr, key_or_uuid = get_translation_attr(product_type), get_product_identifier(product_type)
+    batch_size = 1 if product_type == ProductTypes.XBlock else EMSI_PRODUCT_SKILLS_BATCH_SIZE
+    batch = []
 
     client = EMSISkillsApiClient()
 
@@ -347,33 +513,21 @@ def refresh_product_skills(products, should_commit_to_db: bool, product_type) ->
             translated_skill_attr = get_translated_skill_attribute_val(
                 product[key_or_uuid], skill_attr_val, product_type
             )
-        try:
-            skills = client.get_product_skills(translated_skill_attr)
-        except TaxonomyAPIError:
-            message = f'[TAXONOMY] API Error for key: {product[key_or_uuid]}'
-            LOGGER.error(message)
-            all_failures.append((product[key_or_uuid], message))
-            continue
-
-        # Process the skills from external API and insert it into db.
-        try:
-            failures = process_skills_data(
-                product,
-                skills,
-                should_commit_to_db,
-                product_type,
-                **extra_data
+        batch.append((product, translated_skill_attr, extra_data))
+        if len(batch) >= batch_size:
+            batch_success_count, batch_failures = _process_product_skills_batch(
+                client, batch, should_commit_to_db, product_type, key_or_uuid
             )
-            if failures:
-                LOGGER.info('[TAXONOMY] Skills data received from EMSI. Skills: [%s]', skills)
-                all_failures += failures
-            else:
-                success_count += 1
-        except Exception as ex:  # pylint: disable=broad-except
-            LOGGER.info('[TAXONOMY] Skills data received from EMSI. Skills: [%s]', skills)
-            message = f'[TAXONOMY] Exception for key: {product[key_or_uuid]} Error: {ex}'
-            LOGGER.error(message)
-            all_failures.append((product[key_or_uuid], message))
+            success_count += batch_success_count
+            all_failures += batch_failures
+            batch.clear()
+
+    if batch:
+        batch_success_count, batch_failures = _process_product_skills_batch(
+            client, batch, should_commit_to_db, product_type, key_or_uuid
+        )
+        success_count += batch_success_count
+        all_failures += batch_failures
 
     LOGGER.info(
         '[TAXONOMY] Refresh %s skills process completed. \n'
@@ -63,8 +63,8 @@ class JobSkillsView(View):
         """
         options = set()
         for qs in query_sets:
-            for job_skill in qs:
-                options.add(Option(job_skill.skill.id, job_skill.skill.name))
+            # Only the skill ids and names are read, instead of the job skill and skill models.
+            options.update(Option._make(skill) for skill in qs.values_list('skill__id', 'skill__name'))
         return options
 
     def _get_view_context(self, job_pk):
@@ -72,8 +72,8 @@ class JobSkillsView(View):
         Return the default context parameters.
         """
         job = get_object_or_404(Job, id=job_pk)
-        job_skills, industry_job_skills = job.get_whitelisted_job_skills()
-        excluded_job_skills, excluded_industry_job_skills = job.get_blacklisted_job_skills()
+        job_skills, industry_job_skills = job.get_whitelisted_job_skills(prefetch_skills=False)
+        excluded_job_skills, excluded_industry_job_skills = job.get_blacklisted_job_skills(prefetch_skills=False)
         return {
             self.ContextParameters.JOB: job,
             self.ContextParameters.JOB_SKILLS: self._get_skill_options(job_skills, industry_job_skills),
@@ -123,8 +123,8 @@ class JobSkillsView(View):
             django.http.response.HttpResponse: HttpResponse
         """
         job = Job.objects.get(id=job_pk)
-        job_skills, industry_job_skills = job.get_whitelisted_job_skills()
-        excluded_job_skills, excluded_industry_job_skills = job.get_blacklisted_job_skills()
+        job_skills, industry_job_skills = job.get_whitelisted_job_skills(prefetch_skills=False)
+        excluded_job_skills, excluded_industry_job_skills = job.get_blacklisted_job_skills(prefetch_skills=False)
 
         form = self.form(
             job_skills=self._get_skill_options(job_skills, industry_job_skills),
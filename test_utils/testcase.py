@@ -18,6 +18,13 @@ class TaxonomyTestCase(unittest.TestCase):
     If there is functionality common to all tests then either add a mixin or add it here.
     """
 
+    def setUp(self):
+        """
+        Reset the EMSI API circuit breakers, so that failures of previous tests do not leak into the test.
+        """
+        super().setUp()
+        JwtEMSIApiClient.CIRCUIT_BREAKERS.clear()
+
     @staticmethod
     def mock_access_token(access_token='test-token', expires_in=60):
         """
@@ -9,6 +9,7 @@ from django.db.models.signals import post_save
 
 from taxonomy.models import Job
 from taxonomy.signals.handlers import handle_generate_job_description
+from test_utils.factories import FAKER_OBJECT
 
 
 @pytest.fixture(autouse=True)
@@ -25,3 +26,13 @@ def disconnect_signals(request):
         post_save.connect(handle_generate_job_description, sender=Job)
 
     request.addfinalizer(reconnect_signals)
+
+
+@pytest.fixture(autouse=True)
+def reset_unique_faker():
+    """
+    Pytest fixture to forget the unique values generated by previous tests, whose database rows are rolled back.
+
+    Otherwise the suite runs out of unique job names once enough tests create jobs.
+    """
+    FAKER_OBJECT.unique.clear()
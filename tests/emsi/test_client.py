@@ -3,17 +3,36 @@
 Tests for the `taxonomy-connector` emsi client.
 """
 
+import json
 import logging
-from time import time
+import socket
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import wait as futures_wait
+from time import monotonic, time
 from unittest import mock
 
+import orjson
 import responses
+from edx_django_utils.cache import TieredCache, get_cache_key
 from faker import Faker
-from pytest import raises
+from pytest import raises, warns
 from requests import HTTPError
 from testfixtures import LogCapture
 
-from taxonomy.emsi.client import EMSIJobsApiClient, EMSISkillsApiClient, JwtEMSIApiClient
+from django.core.cache import cache
+from django.test import override_settings
+
+from taxonomy.constants import CACHE_TIMEOUT_EMSI_PRODUCT_SKILLS_SECONDS, EMSI_CIRCUIT_BREAKER_FAILURE_THRESHOLD
+from taxonomy.emsi.client import (
+    CircuitBreaker,
+    EMSIJobsApiClient,
+    EMSISkillsApiClient,
+    JitteredRetry,
+    JwtEMSIApiClient,
+    KeepAliveHTTPAdapter,
+    RateLimiter,
+)
 from taxonomy.enums import RankingFacet
 from taxonomy.exceptions import TaxonomyAPIError
 from test_utils.decorators import mock_api_response
@@ -30,6 +49,115 @@ from test_utils.sample_responses.skills import (
 from test_utils.testcase import TaxonomyTestCase
 
 
+class TestRateLimiter(TaxonomyTestCase):
+    """
+    Validate that the token bucket rate limiter allows bursts up to the rate and then waits for refills.
+    """
+
+    @mock.patch('taxonomy.emsi.client.RateLimiter.acquire_local')
+    @mock.patch('taxonomy.emsi.client.RateLimiter.acquire_shared')
+    def test_acquire(self, acquire_shared_mock, acquire_local_mock):
+        """
+        Validate that `acquire` counts the requests in the Django cache only if it is shared between processes.
+        """
+        rate_limiter = RateLimiter(rate=5)
+
+        rate_limiter.acquire()
+        assert acquire_local_mock.call_count == 1
+        assert acquire_shared_mock.call_count == 0
+
+        with override_settings(CACHES={'default': {'BACKEND': 'django.core.cache.backends.dummy.DummyCache'}}):
+            assert not rate_limiter.is_cache_shared()
+
+        with mock.patch.object(RateLimiter, 'is_cache_shared', return_value=True):
+            rate_limiter.acquire()
+        assert acquire_local_mock.call_count == 1
+        assert acquire_shared_mock.call_count == 1
+
+    @mock.patch('taxonomy.emsi.client.sleep')
+    @mock.patch('taxonomy.emsi.client.monotonic')
+    def test_acquire_local(self, monotonic_mock, sleep_mock):
+        """
+        Validate that `acquire_local` waits only for the time left until the next token is refilled.
+        """
+        monotonic_mock.return_value = 100.0
+        rate_limiter = RateLimiter(rate=5)
+
+        for __ in range(5):
+            rate_limiter.acquire_local()
+        assert sleep_mock.call_count == 0
+
+        rate_limiter.acquire_local()
+        sleep_mock.assert_called_once_with(0.2)
+
+        # 3.5 tokens have been refilled 0.7 seconds later, one of them was reserved by the request that waited.
+        monotonic_mock.return_value = 100.7
+        rate_limiter.acquire_local()
+        rate_limiter.acquire_local()
+        assert sleep_mock.call_count == 1
+        rate_limiter.acquire_local()
+        assert sleep_mock.call_count == 2
+        assert round(sleep_mock.call_args[0][0], 6) == 0.1
+
+    @mock.patch('taxonomy.emsi.client.sleep')
+    @mock.patch('taxonomy.emsi.client.time')
+    def test_acquire_shared(self, time_mock, sleep_mock):
+        """
+        Validate that `acquire_shared` waits for the next second once the shared rate limit of a second is used up.
+        """
+        TieredCache.dangerous_clear_all_tiers()
+        time_mock.return_value = 100.75
+
+        def advance_time(seconds):
+            time_mock.return_value += seconds
+        sleep_mock.side_effect = advance_time
+        rate_limiter = RateLimiter(rate=5)
+
+        for __ in range(5):
+            rate_limiter.acquire_shared()
+        assert sleep_mock.call_count == 0
+
+        rate_limiter.acquire_shared()
+        sleep_mock.assert_called_once_with(0.25)
+
+        # The request that waited is counted against the next second.
+        for __ in range(4):
+            rate_limiter.acquire_shared()
+        assert sleep_mock.call_count == 1
+        rate_limiter.acquire_shared()
+        assert sleep_mock.call_count == 2
+
+
+class TestCircuitBreaker(TaxonomyTestCase):
+    """
+    Validate that the circuit breaker opens after consecutive failures and lets requests through after the cooldown.
+    """
+
+    @mock.patch('taxonomy.emsi.client.monotonic')
+    def test_circuit_breaker(self, monotonic_mock):
+        """
+        Validate the transitions of the circuit breaker.
+        """
+        monotonic_mock.return_value = 100.0
+        circuit_breaker = CircuitBreaker(failure_threshold=2, cooldown=60)
+
+        circuit_breaker.record_failure()
+        assert circuit_breaker.allow_request()
+        circuit_breaker.record_failure()
+        assert not circuit_breaker.allow_request()
+
+        # Requests are let through after the cooldown and a single failure opens the circuit again.
+        monotonic_mock.return_value = 160.0
+        assert circuit_breaker.allow_request()
+        circuit_breaker.record_failure()
+        assert not circuit_breaker.allow_request()
+
+        circuit_breaker.record_success()
+        assert circuit_breaker.allow_request()
+        circuit_breaker.record_failure()
+        assert circuit_breaker.allow_request()
+
+
 class TestJwtEMSIApiClient(TaxonomyTestCase):
     """
     Validate that JWT token are fetched and cached appropriately.
@@ -55,6 +183,19 @@ class TestJwtEMSIApiClient(TaxonomyTestCase):
         token = self.client.oauth_access_token()
         assert token == 'test-token'
         assert self.client.expires_at > 0
+        assert responses.calls[0].request.body == (
+            'grant_type=client_credentials&client_id=test-client&client_secret=test-secret&scope=EMSI'
+        )
+
+        # Access tokens are fetched over the shared keep-alive session.
+        adapter = JwtEMSIApiClient.TOKEN_SESSION.get_adapter(JwtEMSIApiClient.ACCESS_TOKEN_URL)
+        assert isinstance(adapter, KeepAliveHTTPAdapter)
+        assert 503 in adapter.max_retries.status_forcelist
+
+        # The encoded request body is reused for the next access token.
+        self.client.oauth_access_token()
+        assert responses.calls[1].request.body == responses.calls[0].request.body
+        assert list(self.client.token_request_bodies) == ['client_credentials']
 
     @mock_api_response(
         method=responses.POST,
@@ -90,6 +231,172 @@ class TestJwtEMSIApiClient(TaxonomyTestCase):
         assert len(responses.calls) == 1
         assert responses.calls[0].request.url == JwtEMSIApiClient.ACCESS_TOKEN_URL
 
+        # Make sure the pooled connections are kept alive.
+        adapter = self.client.client.get_adapter(JwtEMSIApiClient.API_BASE_URL)
+        assert isinstance(adapter, KeepAliveHTTPAdapter)
+        assert (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1) in adapter.poolmanager.connection_pool_kw['socket_options']
+
+        # Make sure rate limited requests and server errors are retried with a jittered backoff.
+        assert isinstance(adapter.max_retries, JitteredRetry)
+        assert 503 in adapter.max_retries.status_forcelist
+
+        # The session and its pooled connections are kept when the access token is refreshed.
+        session = self.client.client
+        self.client.connect()
+        assert self.client.client is session
+        for scope in ('EMSI', 'postings:us'):
+            client = JwtEMSIApiClient(scope=scope)
+            client.connect()
+            assert (client.client is session) == (scope == 'EMSI')
+
+    @mock.patch('taxonomy.emsi.client.random.uniform', return_value=0.5)
+    def test_jittered_retry_backoff(self, uniform_mock):
+        """
+        Validate that a random jitter is added to the exponential backoff time.
+        """
+        retry = JitteredRetry(total=3, backoff_factor=1).increment().increment()
+
+        assert retry.get_backoff_time() == 2.5
+        uniform_mock.assert_called_once_with(0, 1)
+
+    @mock_api_response(
+        method=responses.POST,
+        url=JwtEMSIApiClient.ACCESS_TOKEN_URL,
+        json={'access_token': 'test-token', 'expires_in': 3600},
+    )
+    def test_get_access_token_cached(self):
+        """
+        Validate that the access token is shared by the clients with the same scope.
+        """
+        self.addCleanup(TieredCache.dangerous_clear_all_tiers)
+        assert self.client.get_access_token() == 'test-token'
+
+        client = JwtEMSIApiClient(scope='EMSI')
+        assert client.get_access_token() == 'test-token'
+        assert client.expires_at == self.client.expires_at
+        assert len(responses.calls) == 1
+
+        # A client with a different scope needs its own access token.
+        JwtEMSIApiClient(scope='postings:us').get_access_token()
+        assert len(responses.calls) == 2
+
+    @mock_api_response(
+        method=responses.POST,
+        url=JwtEMSIApiClient.ACCESS_TOKEN_URL,
+        json={'access_token': 'test-token', 'expires_in': 3600},
+    )
+    @mock.patch('taxonomy.emsi.client.sleep')
+    def test_get_access_token_waits_for_other_process(self, sleep_mock):
+        """
+        Validate that the client waits for the access token being fetched by another process.
+        """
+        self.addCleanup(TieredCache.dangerous_clear_all_tiers)
+        cache_key = get_cache_key(
+            domain='taxonomy', subdomain='emsi_access_token', client_id='test-client', scope='EMSI'
+        )
+        cache.add(f'{cache_key}.lock', True)
+        sleep_mock.side_effect = lambda __: cache.set(cache_key, ('other-token', int(time()) + 3600))
+
+        assert self.client.get_access_token() == 'other-token'
+        assert sleep_mock.call_count == 1
+        assert len(responses.calls) == 0
+
+    @mock_api_response(
+        method=responses.POST,
+        url=JwtEMSIApiClient.ACCESS_TOKEN_URL,
+        json={'access_token': 'test-token', 'expires_in': 3600},
+    )
+    @mock.patch('taxonomy.emsi.client.sleep')
+    def test_get_access_token_keeps_lock_of_other_process(self, sleep_mock):
+        """
+        Validate that the client fetches its own access token without releasing the lock of another process.
+        """
+        self.addCleanup(TieredCache.dangerous_clear_all_tiers)
+        cache_key = get_cache_key(
+            domain='taxonomy', subdomain='emsi_access_token', client_id='test-client', scope='EMSI'
+        )
+        cache.add(f'{cache_key}.lock', True)
+
+        assert self.client.get_access_token() == 'test-token'
+        lock_wait = JwtEMSIApiClient.ACCESS_TOKEN_LOCK_TIMEOUT / JwtEMSIApiClient.ACCESS_TOKEN_LOCK_RETRIES
+        assert sleep_mock.call_args_list.count(mock.call(lock_wait)) == JwtEMSIApiClient.ACCESS_TOKEN_LOCK_RETRIES
+        assert len(responses.calls) == 1
+        assert cache.get(f'{cache_key}.lock')
+
+    @mock_api_response(
+        method=responses.POST,
+        url=JwtEMSIApiClient.ACCESS_TOKEN_URL,
+        json={'access_token': 'test-token', 'expires_in': 3600},
+    )
+    @mock.patch('taxonomy.emsi.client.sleep')
+    def test_get_access_token_rereads_cache_after_last_wait(self, sleep_mock):
+        """
+        Validate that the client uses the access token cached by another process during its last wait.
+        """
+        self.addCleanup(TieredCache.dangerous_clear_all_tiers)
+        cache_key = get_cache_key(
+            domain='taxonomy', subdomain='emsi_access_token', client_id='test-client', scope='EMSI'
+        )
+        cache.add(f'{cache_key}.lock', True)
+
+        lock_waits = []
+
+        def cache_on_last_wait(seconds):
+            lock_waits.append(seconds)
+            if len(lock_waits) == JwtEMSIApiClient.ACCESS_TOKEN_LOCK_RETRIES:
+                cache.set(cache_key, ('other-token', int(time()) + 3600))
+        sleep_mock.side_effect = cache_on_last_wait
+
+        assert self.client.get_access_token() == 'other-token'
+        assert len(responses.calls) == 0
+
+    @override_settings(EMSI_API_BASE_URL='https://emsi.example.com', EMSI_CLIENT_ID='other-client')
+    def test_settings_are_read_lazily(self):
+        """
+        Validate that the clients use the current settings rather than the ones at import time.
+        """
+        assert self.client.client_id == 'other-client'
+        assert JwtEMSIApiClient.API_BASE_URL == 'https://emsi.example.com'
+        assert EMSISkillsApiClient.API_BASE_URL == 'https://emsi.example.com/skills/versions/8.9'
+        assert EMSIJobsApiClient().get_api_url('totals') == 'https://emsi.example.com/jpa/totals'
+
+    def test_optional_settings_are_read_lazily(self):
+        """
+        Validate that the optional settings of the clients fall back to their defaults and are read on access.
+        """
+        assert self.client.circuit_breaker.failure_threshold == EMSI_CIRCUIT_BREAKER_FAILURE_THRESHOLD
+        assert EMSISkillsApiClient.PRODUCT_SKILLS_CACHE_TIMEOUT == CACHE_TIMEOUT_EMSI_PRODUCT_SKILLS_SECONDS
+
+        JwtEMSIApiClient.CIRCUIT_BREAKERS.clear()
+        with override_settings(
+            EMSI_CIRCUIT_BREAKER_FAILURE_THRESHOLD=2, EMSI_CIRCUIT_BREAKER_COOLDOWN_SECONDS=5, EMSI_SKILLS_CACHE_TTL=10
+        ):
+            assert self.client.circuit_breaker.failure_threshold == 2
+            assert self.client.circuit_breaker.cooldown == 5
+            assert EMSISkillsApiClient.PRODUCT_SKILLS_CACHE_TIMEOUT == 10
+
+    @override_settings(EMSI_API_BASE_URL='https://emsi.example.com/base/')
+    def test_api_url_keeps_base_path(self):
+        """
+        Validate that the path of the EMSI API base URL is kept when building the API URLs.
+        """
+        api_base_url = 'https://emsi.example.com/base/skills/versions/8.9'
+        assert EMSISkillsApiClient.API_BASE_URL == api_base_url
+        assert EMSISkillsApiClient().get_api_url('/extract/') == f'{api_base_url}/extract'
+
+    def test_is_token_expired(self):
+        """
+        Validate that the token expiry is not affected by changes of the wall clock.
+        """
+        self.client.expires_at = int(time()) + 120
+        assert not self.client.is_token_expired()
+
+        with mock.patch('taxonomy.emsi.client.time', return_value=time() + 3600):
+            assert not self.client.is_token_expired()
+
+        with mock.patch('taxonomy.emsi.client.monotonic', return_value=monotonic() + 3600):
+            assert self.client.is_token_expired()
+
     @mock_api_response(
         method=responses.POST,
         url=JwtEMSIApiClient.ACCESS_TOKEN_URL,
@@ -100,7 +407,7 @@ class TestJwtEMSIApiClient(TaxonomyTestCase):
         Validate that the behavior of refresh_token decorator.
         """
         # set an expiry value
-        self.client.expires_at = int(time()) + 60
+        self.client.expires_at = int(time()) + 120
 
         # Apply the decorator
         func = self.client.refresh_token(lambda client, *args, **kwargs: None)
@@ -128,6 +435,7 @@ class TestEMSISkillsApiClient(TaxonomyTestCase):
         Instantiate an instance of EMSISkillsApiClient for use inside tests.
         """
         super(TestEMSISkillsApiClient, self).setUp()
+        TieredCache.dangerous_clear_all_tiers()
         self.client = EMSISkillsApiClient()
         self.mock_access_token()
 
@@ -163,12 +471,180 @@ class TestEMSISkillsApiClient(TaxonomyTestCase):
 
         assert skills == SKILLS_EMSI_CLIENT_RESPONSE
 
+    @mock_api_response(
+        method=responses.POST,
+        url=EMSISkillsApiClient.API_BASE_URL + '/extract',
+        json=SKILLS_EMSI_RESPONSE,
+    )
+    def test_get_product_skills_cached(self):
+        """
+        Validate that the client fetches the skills of the same text from EMSI API only once.
+        """
+        assert self.client.get_product_skills(SKILL_TEXT_DATA) == SKILLS_EMSI_CLIENT_RESPONSE
+        assert self.client.get_product_skills(SKILL_TEXT_DATA) == SKILLS_EMSI_CLIENT_RESPONSE
+        extract_url = EMSISkillsApiClient.API_BASE_URL + '/extract'
+        assert [call.request.url for call in responses.calls].count(extract_url) == 1
+
+        self.client.get_product_skills(SKILL_TEXT_DATA + ' Changed.')
+        assert [call.request.url for call in responses.calls].count(extract_url) == 2
+
+    def _get_product_skills_concurrently(self, fetch_result):
+        """
+        Call `get_product_skills` for the same text from two threads while the first call is in flight.
+
+        The product skills cache always misses, so that only the in-flight request can be shared by the calls.
+
+        Returns:
+            (list, Mock): The futures of both calls and the mock of `fetch_product_skills`.
+        """
+        fetch_started = threading.Event()
+        release_fetch = threading.Event()
+        second_waiting = threading.Event()
+
+        class WaitedFuture(Future):
+            """
+            Future that signals when a thread starts waiting for its result.
+            """
+
+            def result(self, timeout=None):
+                """
+                Signal that a thread is waiting for the result, then wait for it without hanging the tests.
+                """
+                second_waiting.set()
+                return super().result(timeout or 5)
+
+        def fetch_product_skills(_text_data):
+            fetch_started.set()
+            release_fetch.wait(5)
+            return fetch_result()
+
+        with mock.patch('taxonomy.emsi.client.cache.get', return_value=None), \
+                mock.patch('taxonomy.emsi.client.Future', WaitedFuture), \
+                mock.patch.object(self.client, 'fetch_product_skills', side_effect=fetch_product_skills) as fetch_mock:
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                first = executor.submit(self.client.get_product_skills, SKILL_TEXT_DATA)
+                assert fetch_started.wait(5)
+                assert len(EMSISkillsApiClient.IN_FLIGHT_PRODUCT_SKILLS) == 1
+
+                second = executor.submit(self.client.get_product_skills, SKILL_TEXT_DATA)
+                assert second_waiting.wait(5)
+                release_fetch.set()
+                futures_wait([first, second], timeout=5)
+        return [first, second], fetch_mock
+
+    def test_get_product_skills_single_flight(self):
+        """
+        Validate that concurrent calls for the skills of the same text share a single request.
+        """
+        futures, fetch_mock = self._get_product_skills_concurrently(lambda: SKILLS_EMSI_CLIENT_RESPONSE)
+
+        assert [future.result() for future in futures] == [SKILLS_EMSI_CLIENT_RESPONSE] * 2
+        assert fetch_mock.call_count == 1
+        assert not EMSISkillsApiClient.IN_FLIGHT_PRODUCT_SKILLS
+
+    def test_get_product_skills_single_flight_interrupted(self):
+        """
+        Validate that the waiting calls are released when the in-flight request is interrupted.
+        """
+        class Interrupted(BaseException):
+            """
+            Interruption that is not an `Exception`, e.g. a task timeout.
+            """
+
+        def interrupt():
+            raise Interrupted()
+
+        futures, fetch_mock = self._get_product_skills_concurrently(interrupt)
+
+        for future in futures:
+            with self.assertRaises(Interrupted):
+                future.result()
+        assert fetch_mock.call_count == 1
+        assert not EMSISkillsApiClient.IN_FLIGHT_PRODUCT_SKILLS
+
+    @mock_api_response(
+        method=responses.POST,
+        url=EMSISkillsApiClient.API_BASE_URL + '/extract',
+        json=SKILLS_EMSI_RESPONSE,
+    )
+    def test_get_product_skills_short_text(self):
+        """
+        Validate that the client does not query EMSI API for texts too short to extract skills from.
+        """
+        with LogCapture(level=logging.DEBUG) as log_capture:
+            for text_data in (None, '', '   ', '<div class="description"><p> </p></div>'):
+                assert self.client.get_product_skills(text_data) == {'data': []}
+        assert len(log_capture.records) == 4
+        assert len(responses.calls) == 0
+
+        assert self.client.get_product_skills('   Python   ') == SKILLS_EMSI_CLIENT_RESPONSE
+        assert len(responses.calls) == 2
+
+        with override_settings(EMSI_MIN_TEXT_LENGTH=32):
+            for text_data in ('   Python and Django   ', '<p>   Python and Django   </p>'):
+                assert self.client.get_product_skills(text_data) == {'data': []}
+        assert len(responses.calls) == 2
+
+    @mock_api_response(
+        method=responses.POST,
+        url=EMSISkillsApiClient.API_BASE_URL + '/extract',
+        json=SKILLS_EMSI_RESPONSE,
+    )
+    def test_get_product_skills_bulk(self):
+        """
+        Validate that the client fetches the skills of several products with a single access token.
+        """
+        # Make sure the access token does not expire while the rate limiter waits.
+        self.addCleanup(TieredCache.dangerous_clear_all_tiers)
+        responses.replace(
+            responses.POST, JwtEMSIApiClient.ACCESS_TOKEN_URL, json={'access_token': 'test-token', 'expires_in': 3600}
+        )
+        skills = self.client.get_product_skills_bulk([f'{SKILL_TEXT_DATA} {index}' for index in range(3)])
+
+        assert skills == [SKILLS_EMSI_CLIENT_RESPONSE] * 3
+        request_urls = [call.request.url for call in responses.calls]
+        assert request_urls.count(JwtEMSIApiClient.ACCESS_TOKEN_URL) == 1
+        assert len(request_urls) == 4
+
+    @mock_api_response(
+        method=responses.POST,
+        url=EMSISkillsApiClient.API_BASE_URL + '/extract',
+        json={'error': 'Server Error'},
+        status=500,
+    )
+    def test_get_product_skills_bulk_error(self):
+        """
+        Validate that the client returns an error in place of the skills of products that could not be fetched.
+        """
+        skills = self.client.get_product_skills_bulk([SKILL_TEXT_DATA] * 2)
+
+        assert len(skills) == 2
+        assert all(isinstance(product_skills, TaxonomyAPIError) for product_skills in skills)
+
+    def test_traverse_skills_data_without_description(self):
+        """
+        Validate that skills without a "wikipediaExtract" tag get an empty description.
+        """
+        response = {'data': [
+            {'skill': {'id': skill_id, 'tags': [{'key': 'wikipediaUrl', 'value': 'url'}]}}
+            for skill_id in (SKILL_ID, 'KS0000000000000000')
+        ]}
+        with LogCapture(level=logging.WARNING) as log_capture:
+            skills = self.client.traverse_skills_data(response)
+
+        assert [skill['skill']['description'] for skill in skills['data']] == ['', '']
+        log_capture.check((
+            'taxonomy.emsi.client',
+            'WARNING',
+            f'[TAXONOMY] "wikipediaExtract" key not found in 2 skills: [\'{SKILL_ID}\', \'KS0000000000000000\']',
+        ))
+
     def test_get_product_skills_large_text(self):
         """
         Validate that the behavior of client while fetching product skills for very large text.
         """
         api_response = mock.Mock()
-        api_response.json.return_value = SKILLS_EMSI_RESPONSE
+        api_response.content = json.dumps(SKILLS_EMSI_RESPONSE)
         self.client.is_token_expired = mock.Mock(return_value=False)
         self.client.client = mock.MagicMock(post=mock.Mock(return_value=api_response))
 
@@ -176,7 +652,8 @@ class TestEMSISkillsApiClient(TaxonomyTestCase):
         skill_text_data = Faker().text(max_data_size + max_data_size * 0.1)
         self.client.get_product_skills(skill_text_data)
 
-        assert len(self.client.client.post.call_args_list[0][1]['json']['text']) == max_data_size
+        assert len(orjson.loads(self.client.client.post.call_args_list[0][1]['data'])['text']) == max_data_size
+        assert self.client.client.post.call_args_list[0][1]['timeout'] == (3.05, 30)
 
     @mock_api_response(
         method=responses.POST,
@@ -191,6 +668,73 @@ class TestEMSISkillsApiClient(TaxonomyTestCase):
         with raises(TaxonomyAPIError, match='Error while fetching product skills.'):
             self.client.get_product_skills(SKILL_TEXT_DATA)
 
+    @mock_api_response(
+        method=responses.POST,
+        url=EMSISkillsApiClient.API_BASE_URL + '/extract',
+        body='<html>Bad Gateway</html>',
+    )
+    def test_get_product_skills_invalid_json(self):
+        """
+        Validate that the client raises an error when EMSI API returns a response that is not valid JSON.
+        """
+        with raises(TaxonomyAPIError, match='Error while fetching product skills.'):
+            self.client.get_product_skills(SKILL_TEXT_DATA)
+
+    @mock_api_response(
+        method=responses.POST,
+        url=EMSISkillsApiClient.API_BASE_URL + '/extract',
+        json={'error': 'Server Error'},
+        status=501,
+    )
+    def test_circuit_breaker_opens_on_server_errors(self):
+        """
+        Validate that the client stops querying EMSI API after consecutive server errors.
+        """
+        circuit_breakers = {self.client.scope: CircuitBreaker(failure_threshold=2, cooldown=60)}
+        with mock.patch.dict(JwtEMSIApiClient.CIRCUIT_BREAKERS, circuit_breakers):
+            for __ in range(2):
+                with raises(TaxonomyAPIError, match='Error while fetching product skills.'):
+                    self.client.get_product_skills(SKILL_TEXT_DATA)
+            request_count = len(responses.calls)
+
+            with raises(TaxonomyAPIError, match='circuit breaker is open'):
+                self.client.get_product_skills(SKILL_TEXT_DATA)
+            assert len(responses.calls) == request_count
+
+    @mock_api_response(
+        method=responses.POST,
+        url=EMSISkillsApiClient.API_BASE_URL + '/extract',
+        json={'error': 'Bad Request'},
+        status=400,
+    )
+    def test_circuit_breaker_ignores_client_errors(self):
+        """
+        Validate that client errors do not open the circuit.
+        """
+        circuit_breakers = {self.client.scope: CircuitBreaker(failure_threshold=2, cooldown=60)}
+        with mock.patch.dict(JwtEMSIApiClient.CIRCUIT_BREAKERS, circuit_breakers):
+            for __ in range(3):
+                with raises(TaxonomyAPIError, match='Error while fetching product skills.'):
+                    self.client.get_product_skills(SKILL_TEXT_DATA)
+
+    @mock_api_response(
+        method=responses.POST,
+        url=EMSISkillsApiClient.API_BASE_URL + '/extract',
+        json={'error': 'Server Error'},
+        status=501,
+    )
+    def test_circuit_breaker_per_scope(self):
+        """
+        Validate that the circuit breaker of a scope does not affect the clients of other scopes.
+        """
+        circuit_breakers = {self.client.scope: CircuitBreaker(failure_threshold=1, cooldown=60)}
+        with mock.patch.dict(JwtEMSIApiClient.CIRCUIT_BREAKERS, circuit_breakers):
+            with raises(TaxonomyAPIError, match='Error while fetching product skills.'):
+                self.client.get_product_skills(SKILL_TEXT_DATA)
+
+            assert not EMSISkillsApiClient().circuit_breaker.allow_request()
+            assert EMSIJobsApiClient().circuit_breaker.allow_request()
+
     @mock_api_response(
         method=responses.GET,
         url=EMSISkillsApiClient.API_BASE_URL + f'/skills/{SKILL_ID}',
@@ -204,6 +748,23 @@ class TestEMSISkillsApiClient(TaxonomyTestCase):
 
         assert skills == SKILL_DETAILS_EMSI_RESPONSE
 
+    @mock_api_response(
+        method=responses.GET,
+        url=EMSISkillsApiClient.API_BASE_URL + f'/skills/{SKILL_ID}',
+        json=SKILL_DETAILS_EMSI_RESPONSE,
+    )
+    def test_get_skill_details_cached(self):
+        """
+        Validate that the client fetches the details of a skill from the EMSI API only once.
+        """
+        assert self.client.get_skill_details(SKILL_ID) == SKILL_DETAILS_EMSI_RESPONSE
+        assert EMSISkillsApiClient().get_skill_details(SKILL_ID) == SKILL_DETAILS_EMSI_RESPONSE
+
+        skill_details_urls = [
+            call.request.url for call in responses.calls if call.request.url != JwtEMSIApiClient.ACCESS_TOKEN_URL
+        ]
+        assert skill_details_urls == [EMSISkillsApiClient.API_BASE_URL + f'/skills/{SKILL_ID}']
+
     @mock_api_response(
         method=responses.GET,
         url=EMSISkillsApiClient.API_BASE_URL + f'/skills/{SKILL_ID}',
@@ -214,8 +775,15 @@ class TestEMSISkillsApiClient(TaxonomyTestCase):
         """
         Validate that the behavior of client when error occurs while fetching skill data.
         """
-        with raises(TaxonomyAPIError, match='Error while fetching skill details.'):
-            self.client.get_skill_details(SKILL_ID)
+        with LogCapture(level=logging.ERROR) as log_capture:
+            with raises(TaxonomyAPIError, match='Error while fetching skill details.'):
+                self.client.get_skill_details(SKILL_ID)
+
+        log_capture.check_present((
+            'taxonomy.emsi.client',
+            'ERROR',
+            f'[TAXONOMY] Exception raised while fetching skill details from EMSI. Skill ID: [{SKILL_ID}]',
+        ))
 
 
 class TestEMSIJobsApiClient(TaxonomyTestCase):
@@ -230,6 +798,15 @@ class TestEMSIJobsApiClient(TaxonomyTestCase):
         self.mock_access_token()
         self.client = EMSIJobsApiClient()
 
+    def test_traverse_data_deprecated(self):
+        """
+        Validate that the pass-through traverse methods still return the data, with a deprecation warning.
+        """
+        with warns(DeprecationWarning, match='traverse_jobs_data is deprecated'):
+            assert self.client.traverse_jobs_data(JOBS) == JOBS
+        with warns(DeprecationWarning, match='traverse_job_postings_data is deprecated'):
+            assert self.client.traverse_job_postings_data(JOB_POSTINGS) == JOB_POSTINGS
+
     @mock_api_response(
         method=responses.POST,
         url=EMSIJobsApiClient.API_BASE_URL + '/rankings/{}/rankings/{}'.format(
@@ -244,6 +821,9 @@ class TestEMSIJobsApiClient(TaxonomyTestCase):
         jobs = self.client.get_jobs(RankingFacet.TITLE_NAME, RankingFacet.SKILLS_NAME, JOBS_FILTER)
 
         assert jobs == JOBS
+        request = responses.calls[-1].request
+        assert request.headers['Content-Type'] == 'application/json'
+        assert orjson.loads(request.body) == JOBS_FILTER
 
     @mock_api_response(
         method=responses.POST,
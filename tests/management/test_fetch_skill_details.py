@@ -3,6 +3,7 @@
 Tests for the django management command `fetch_skill_details`.
 """
 import responses
+from edx_django_utils.cache import TieredCache
 from faker import Faker
 from pytest import mark, raises
 
@@ -11,7 +12,7 @@ from django.core.management.base import CommandError
 
 from taxonomy.emsi.client import EMSISkillsApiClient
 from taxonomy.emsi.parsers.skill_parsers import INVALID_NAMES
-from taxonomy.models import Skill, SkillCategory, SkillSubCategory
+from taxonomy.models import JobSkillCategoryRollup, Skill, SkillCategory, SkillSubCategory
 from test_utils import factories
 from test_utils.testcase import TaxonomyTestCase
 
@@ -29,7 +30,7 @@ class RefreshCourseSkillsCommandTests(TaxonomyTestCase):
 
     def setUp(self):
         super().setUp()
-
+        TieredCache.dangerous_clear_all_tiers()
         self.mock_access_token()
 
     @responses.activate
@@ -226,3 +227,52 @@ class RefreshCourseSkillsCommandTests(TaxonomyTestCase):
         # Validate the for missing category and subcategory both category and subcategory are not saved.
         assert SkillCategory.objects.count() == 0
         assert SkillSubCategory.objects.count() == 0
+
+    @responses.activate
+    def test_shared_skill_category_and_subcategory(self):
+        """
+        Test that the category and subcategory shared by several skills are created once and existing ones are kept.
+        """
+        existing_category = factories.SkillCategoryFactory(id=1, name='Existing Category')
+        skills = factories.SkillFactory.create_batch(3, category=None, subcategory=None)
+        for skill in skills:
+            responses.add(
+                method=responses.GET,
+                url=EMSISkillsApiClient.API_BASE_URL + f'/skills/{skill.external_id}',
+                json={
+                    'data': {
+                        'category': {'id': existing_category.id, 'name': 'Renamed Category'},
+                        'subcategory': {'id': 2, 'name': 'Subcategory'},
+                    }
+                },
+            )
+
+        call_command(self.command)
+
+        assert SkillCategory.objects.get().name == 'Existing Category'
+        subcategory = SkillSubCategory.objects.get()
+        assert (subcategory.id, subcategory.name, subcategory.category) == (2, 'Subcategory', existing_category)
+        assert set(Skill.objects.filter(category=existing_category, subcategory=subcategory)) == set(skills)
+
+    @responses.activate
+    def test_job_skill_category_rollups_refreshed(self):
+        """
+        Test that the skill category rollups of the jobs whose skills got a category are rebuilt.
+        """
+        skill = factories.SkillFactory(category=None, subcategory=None)
+        job_skill = factories.JobSkillFactory(skill=skill, significance=2, unique_postings=20)
+        responses.add(
+            method=responses.GET,
+            url=EMSISkillsApiClient.API_BASE_URL + f'/skills/{skill.external_id}',
+            json={
+                'data': {
+                    'category': {'id': 1, 'name': 'Category'},
+                    'subcategory': {'id': 2, 'name': 'Subcategory'},
+                }
+            },
+        )
+
+        call_command(self.command)
+
+        rollup = JobSkillCategoryRollup.objects.get(job=job_skill.job)
+        assert (rollup.category_id, rollup.total_significance, rollup.total_skills) == (1, 2, 1)
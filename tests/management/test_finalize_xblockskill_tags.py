@@ -236,3 +236,24 @@ class FinalizeSkillTagsCommandTests(TaxonomyTestCase):
             )
         updated_xblockskill = XBlockSkillData.objects.first()  # there's only one
         self.assertFalse(updated_xblockskill.verified)
+
+    def test_finalize_xblockskill_tags_verification_over_blacklisting(self):
+        """
+        Test that tags crossing both the verification and the ignored thresholds are only verified.
+        """
+        xblock = factories.XBlockSkillsFactory(usage_key=USAGE_KEY)
+        factories.XBlockSkillDataFactory(xblock=xblock, verified_count=5, ignored_count=5)
+        factories.XBlockSkillDataFactory(xblock=xblock, verified_count=None, ignored_count=5)
+
+        call_command(
+            self.command,
+            min_verified_votes=1,
+            ratio_verified_threshold=0.4,
+            min_ignored_votes=1,
+            ratio_ignored_threshold=0.4,
+        )
+
+        self.assertEqual(
+            set(XBlockSkillData.objects.values_list('verified_count', 'verified', 'is_blacklisted')),
+            {(5, True, False), (None, False, True)},
+        )
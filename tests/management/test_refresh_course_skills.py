@@ -144,6 +144,25 @@ class RefreshCourseSkillsCommandTests(TaxonomyTestCase):
         self.assertEqual(skill.count(), 4)
         self.assertEqual(course_skill.count(), 12)
 
+    @mock.patch('taxonomy.management.commands.refresh_course_skills.get_course_metadata_provider')
+    @mock.patch('taxonomy.management.commands.refresh_course_skills.utils.EMSISkillsApiClient.get_product_skills')
+    def test_duplicate_course_ids_are_requested_once(self, get_product_skills_mock, get_course_provider_mock):
+        """
+        Test that the command requests the metadata of a repeated course only once.
+        """
+        get_product_skills_mock.return_value = self.skills_emsi_client_response
+        get_course_provider_mock.return_value.get_courses.return_value = [self.course_1, self.course_2]
+
+        call_command(
+            self.command, '--course', self.course_1.uuid, '--course', self.course_2.uuid,
+            '--course', self.course_1.uuid, '--commit',
+        )
+
+        get_course_provider_mock.return_value.get_courses.assert_called_once_with(
+            course_ids=[str(self.course_1.uuid), str(self.course_2.uuid)]
+        )
+        self.assertEqual(CourseSkills.objects.count(), 8)
+
     @mock.patch('taxonomy.management.commands.refresh_course_skills.get_course_metadata_provider')
     @mock.patch('taxonomy.management.commands.refresh_course_skills.utils.EMSISkillsApiClient.get_product_skills')
     def test_course_skill_saved_with_all_param(self, get_product_skills_mock, get_course_provider_mock):
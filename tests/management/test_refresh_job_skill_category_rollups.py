@@ -0,0 +1,87 @@
+# -*- coding: utf-8 -*-
+"""
+Tests for the django management command `refresh_job_skill_category_rollups`.
+"""
+
+from unittest import mock
+
+from edx_django_utils.cache import TieredCache
+from pytest import mark
+
+from django.core.management import call_command
+
+from taxonomy.models import JobSkillCategoryRollup, Skill
+from taxonomy.utils import get_job_top_skill_categories_cache_key
+from test_utils.factories import JobFactory, JobSkillFactory, SkillCategoryFactory
+from test_utils.testcase import TaxonomyTestCase
+
+
+@mark.django_db
+class RefreshJobSkillCategoryRollupsCommandTests(TaxonomyTestCase):
+    """
+    Test command `refresh_job_skill_category_rollups`.
+    """
+
+    command = 'refresh_job_skill_category_rollups'
+
+    def setUp(self):
+        """
+        Testcase Setup.
+        """
+        super().setUp()
+        self.job = JobFactory()
+        self.job_skill_a = JobSkillFactory(job=self.job, significance=1, unique_postings=10)
+        self.job_skill_b = JobSkillFactory(job=self.job, significance=2, unique_postings=20)
+
+    def test_rollups_are_rebuilt(self):
+        """
+        Test that the command rebuilds the rollups from the current categories of the job skills.
+        """
+        category = SkillCategoryFactory()
+        Skill.objects.filter(
+            id__in=[self.job_skill_a.skill_id, self.job_skill_b.skill_id]
+        ).update(category=category)
+        # Queryset updates do not send signals, so the rollups are stale until the command runs.
+        assert not JobSkillCategoryRollup.objects.filter(category=category).exists()
+
+        call_command(self.command)
+
+        rollups = JobSkillCategoryRollup.objects.filter(job=self.job)
+        assert rollups.count() == 1
+        rollup = rollups.get()
+        assert rollup.category == category
+        assert rollup.total_significance == 3
+        assert rollup.total_unique_postings == 30
+        assert rollup.total_skills == 2
+
+    def test_cached_top_skill_categories_are_invalidated(self):
+        """
+        Test that the command drops the cached top skill categories of the rebuilt jobs.
+        """
+        cache_key = get_job_top_skill_categories_cache_key(self.job.id)
+        TieredCache.set_all_tiers(cache_key, {'job': self.job.name, 'skill_categories': []})
+
+        with mock.patch('taxonomy.utils.TieredCache.delete_all_tiers') as delete_all_tiers_mock:
+            call_command(self.command)
+        delete_all_tiers_mock.assert_not_called()
+
+        # The version of the cache keys is replaced instead of deleting the key of every job.
+        assert get_job_top_skill_categories_cache_key(self.job.id) != cache_key
+        assert not TieredCache.get_cached_response(get_job_top_skill_categories_cache_key(self.job.id)).is_found
+
+    def test_rollups_are_rebuilt_on_skill_category_change(self):
+        """
+        Test that changing the category of a skill, e.g. in the admin, rebuilds the rollups of its jobs.
+        """
+        category = SkillCategoryFactory()
+        skill = Skill.objects.get(id=self.job_skill_a.skill_id)
+        skill.category = category
+        skill.save()
+
+        rollup = JobSkillCategoryRollup.objects.get(job=self.job, category=category)
+        assert rollup.total_significance == 1
+
+        # Saving the skill again without changing its category does not rebuild the rollups.
+        with mock.patch('taxonomy.signals.handlers.refresh_job_skill_category_rollups') as refresh_mock:
+            skill.save()
+        refresh_mock.assert_not_called()
@@ -68,6 +68,19 @@ class RefreshJobSkillsCommandTests(TaxonomyTestCase):
         self.assertEqual(JobSkills.objects.all().count(), expected_job_skill_count)
         self.assertEqual(IndustryJobSkill.objects.all().count(), industry_count * expected_job_skill_count)
 
+    @responses.activate
+    @mock.patch('taxonomy.utils.refresh_job_skill_category_rollups')
+    @mock.patch('taxonomy.management.commands.refresh_job_skills.EMSIJobsApiClient.get_jobs')
+    def test_job_skill_category_rollups_rebuilt_once(self, get_job_skills_mock, refresh_rollups_mock):
+        """
+        Test that the command rebuilds the skill category rollups once for all the jobs whose skills were saved.
+        """
+        get_job_skills_mock.return_value = self.jobs
+
+        call_command(self.command)
+
+        refresh_rollups_mock.assert_called_once_with(job_ids=sorted(Job.objects.values_list('id', flat=True)))
+
     @responses.activate
     @mock.patch('taxonomy.management.commands.refresh_job_skills.EMSIJobsApiClient.get_jobs')
     def test_job_skills_not_saved_upon_exception(self, get_job_skills_mock):
@@ -5,6 +5,7 @@ Tests for the taxonomy models.
 from unittest.mock import patch
 
 import pytest
+from edx_django_utils.cache import TieredCache
 from pytest import mark
 
 from django.conf import settings
@@ -345,7 +346,7 @@ class TestJob(TestCase):
         assert expected_repr == job.__repr__()
 
     @pytest.mark.use_signals
-    @patch('taxonomy.openai.client.requests.post')
+    @patch('taxonomy.openai.client.SESSION.post')
     @patch('taxonomy.utils.generate_and_store_job_description', wraps=generate_and_store_job_description)
     @patch('taxonomy.signals.handlers.generate_job_description.delay', wraps=generate_job_description)
     def test_chat_completion_is_called(   # pylint: disable=invalid-name
@@ -742,6 +743,7 @@ class SkillValidationConfigurationTests(TestCase):
         self.provider_patcher = patch('taxonomy.models.get_course_metadata_provider')
         self.mock_provider = self.provider_patcher.start()
         self.mock_provider.return_value = DiscoveryCourseMetadataProvider(self.courses)
+        TieredCache.dangerous_clear_all_tiers()
 
     def tearDown(self):
         super().tearDown()
@@ -808,6 +810,46 @@ class SkillValidationConfigurationTests(TestCase):
         """
         assert SkillValidationConfiguration.is_disabled(course_run_key='course-v1:org+course+run') is False
 
+    def test_model_is_disabled_is_cached(self):
+        """
+        Verify that `is_disabled` caches its result for a course run key.
+        """
+        factories.SkillValidationConfigurationFactory(course_key=self.mock_course_run.course_key)
+        assert SkillValidationConfiguration.is_disabled(course_run_key=self.mock_course_run.course_run_key)
+
+        with self.assertNumQueries(0):
+            assert SkillValidationConfiguration.is_disabled(course_run_key=self.mock_course_run.course_run_key)
+
+    def test_model_is_disabled_cache_invalidated(self):
+        """
+        Verify that saving or deleting a configuration invalidates the cached `is_disabled` results.
+        """
+        course_run_key = self.mock_course_run.course_run_key
+        organization = self.courses[0].key.split('+')[0]
+        assert SkillValidationConfiguration.is_disabled(course_run_key=course_run_key) is False
+
+        disabled_config = factories.SkillValidationConfigurationFactory(organization=organization)
+        assert SkillValidationConfiguration.is_disabled(course_run_key=course_run_key)
+
+        disabled_config.delete()
+        assert SkillValidationConfiguration.is_disabled(course_run_key=course_run_key) is False
+
+        factories.SkillValidationConfigurationFactory(course_key=self.mock_course_run.course_key)
+        assert SkillValidationConfiguration.is_disabled(course_run_key=course_run_key)
+
+    def test_model_is_disabled_cache_invalidated_on_edit(self):
+        """
+        Verify that editing a configuration invalidates the cached `is_disabled` results of its previous values.
+        """
+        course_run_key = self.mock_course_run.course_run_key
+        organization = self.courses[0].key.split('+')[0]
+        disabled_config = factories.SkillValidationConfigurationFactory(organization=organization)
+        assert SkillValidationConfiguration.is_disabled(course_run_key=course_run_key)
+
+        disabled_config.organization = self.courses[1].key.split('+')[0]
+        disabled_config.save()
+        assert SkillValidationConfiguration.is_disabled(course_run_key=course_run_key) is False
+
     def test_model_object_str_with_course_key(self):
         """
         Verify that SkillValidationConfiguration model __str__ work as expected for a course key.
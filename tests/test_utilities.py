@@ -13,15 +13,15 @@ from testfixtures import LogCapture
 
 from taxonomy import models, utils
 from taxonomy.choices import ProductTypes
-from taxonomy.constants import ENGLISH
-from taxonomy.emsi.client import EMSISkillsApiClient
+from taxonomy.constants import EMSI_API_RATE_LIMIT_PER_SEC, ENGLISH
+from taxonomy.emsi.client import EMSISkillsApiClient, JwtEMSIApiClient, RateLimiter
 from taxonomy.exceptions import SkipProductProcessingError, TaxonomyAPIError
 from taxonomy.models import CourseSkills, Industry, Job, JobSkills, Skill, Translation, XBlockSkillData, XBlockSkills
 from test_utils import factories
 from test_utils.constants import COURSE_KEY, PROGRAM_UUID, USAGE_KEY
 from test_utils.decorators import mock_api_response
 from test_utils.mocks import MockCourse, MockProgram, MockXBlock, mock_as_dict
-from test_utils.sample_responses.skills import SKILLS_EMSI_CLIENT_RESPONSE, SKILLS_EMSI_RESPONSE
+from test_utils.sample_responses.skills import SKILL_TEXT_DATA, SKILLS_EMSI_CLIENT_RESPONSE, SKILLS_EMSI_RESPONSE
 from test_utils.testcase import TaxonomyTestCase
 
 
@@ -48,6 +48,24 @@ class TestUtils(TaxonomyTestCase):
         """
         self.django_assert_num_queries = django_assert_num_queries
 
+    @mock.patch('taxonomy.utils.refresh_job_skill_category_rollups')
+    def test_deferred_job_skill_category_rollups(self, refresh_rollups_mock):
+        """
+        Validate that job skills saved inside `deferred_job_skill_category_rollups` rebuild each job's rollups once.
+        """
+        job, other_job = factories.JobFactory.create_batch(2)
+        with utils.deferred_job_skill_category_rollups():
+            factories.JobSkillFactory.create_batch(3, job=job)
+            with utils.deferred_job_skill_category_rollups():
+                factories.JobSkillFactory(job=other_job)
+            assert refresh_rollups_mock.call_count == 0
+
+        refresh_rollups_mock.assert_called_once_with(job_ids=sorted([job.id, other_job.id]))
+
+        # Outside of the block the rollups are rebuilt right away.
+        factories.JobSkillFactory(job=job)
+        refresh_rollups_mock.assert_called_with(job_ids=[job.id])
+
     def test_blacklist_course_skill(self):
         """
         Validate that blacklist_course_skill works as expected.
@@ -936,10 +954,12 @@ class TestUtils(TaxonomyTestCase):
     )
     @mock.patch('taxonomy.utils.get_translated_skill_attribute_val')
     @mock.patch('taxonomy.emsi.client.sleep')
+    @mock.patch('taxonomy.emsi.client.monotonic')
     @mock.patch('taxonomy.emsi.client.time')
     def test_refresh_course_skills_rate_limit_emsi_api_calls(
             self,
             time_mock,
+            monotonic_mock,
             time_sleep_mock,
             get_translated_description_mock,
     ):
@@ -947,11 +967,17 @@ class TestUtils(TaxonomyTestCase):
         Validate that `refresh_product_skills` rate limits API calls to EMSI.
         """
         self.mock_access_token()
-        time_mock.return_value = 1  # Freeze time for the test.
-        get_translated_description_mock.return_value = None
-        time_sleep_mock.return_value = None
+        # Freeze time for the test.
+        time_mock.return_value = 1
+        monotonic_mock.return_value = 1
+        TieredCache.dangerous_clear_all_tiers()
+        get_translated_description_mock.side_effect = lambda key, *args: f'{SKILL_TEXT_DATA} {key}'
+
+        def advance_time(seconds):
+            time_mock.return_value += seconds
+            monotonic_mock.return_value += seconds
+        time_sleep_mock.side_effect = advance_time
 
-        EMSISkillsApiClient.REQUEST_COUNT_CACHE.clear()
         product_type = ProductTypes.Course
 
         courses = []
@@ -965,10 +991,13 @@ class TestUtils(TaxonomyTestCase):
                 'full_description': course.full_description,
             })
 
-        utils.refresh_product_skills(courses, False, product_type)
+        with mock.patch.object(JwtEMSIApiClient, 'RATE_LIMITER', RateLimiter(EMSI_API_RATE_LIMIT_PER_SEC)):
+            utils.refresh_product_skills(courses, False, product_type)
 
-        # It should be called at the 6th request made in the current second
-        assert time_sleep_mock.call_count == 1
+        # The local memory cache is not shared between processes, so every request after the first ones allowed by the
+        # bucket waits once for the next token, 1 / EMSI_API_RATE_LIMIT_PER_SEC seconds later.
+        assert time_sleep_mock.call_count == len(responses.calls) - EMSI_API_RATE_LIMIT_PER_SEC
+        assert {round(call.args[0], 6) for call in time_sleep_mock.call_args_list} == {1 / EMSI_API_RATE_LIMIT_PER_SEC}
 
     def test_refresh_program_skills_skipped(self):
         """
@@ -1000,6 +1029,22 @@ class TestUtils(TaxonomyTestCase):
             messages = [record.msg for record in log_capture.records]
             self.assertIn(f'[TAXONOMY] API Error for key: {program["uuid"]}', messages)
 
+    @mock.patch('taxonomy.utils.EMSI_PRODUCT_SKILLS_BATCH_SIZE', 2)
+    @mock.patch('taxonomy.utils.translate_text')
+    @mock.patch('taxonomy.utils.EMSISkillsApiClient.get_product_skills_bulk')
+    def test_refresh_program_skills_in_batches(self, mock_emsi_skills_bulk, mock_translate):
+        """
+        Validate that `refresh_product_skills` fetches the skills of the products from EMSI in batches.
+        """
+        mock_emsi_skills_bulk.side_effect = lambda texts: [SKILLS_EMSI_CLIENT_RESPONSE] * len(texts)
+        mock_translate.return_value = {'SourceLanguageCode': '', 'TranslatedText': ''}
+        programs = [mock_as_dict(MockProgram()) for __ in range(3)]
+
+        success_count, failure_count = utils.refresh_product_skills(programs, False, ProductTypes.Program)
+
+        assert (success_count, failure_count) == (3, 0)
+        assert [len(call_args[0][0]) for call_args in mock_emsi_skills_bulk.call_args_list] == [2, 1]
+
     @mock.patch('taxonomy.utils.translate_text')
     @mock.patch('taxonomy.utils.process_skills_data')
     @mock.patch('taxonomy.utils.EMSISkillsApiClient.get_product_skills')
@@ -1028,11 +1073,13 @@ class TestUtils(TaxonomyTestCase):
         json=SKILLS_EMSI_RESPONSE,
     )
     @mock.patch('taxonomy.utils.translate_text')
-    @mock.patch('taxonomy.emsi.client.sleep', return_value=None)
+    @mock.patch('taxonomy.emsi.client.sleep')
+    @mock.patch('taxonomy.emsi.client.monotonic')
     @mock.patch('taxonomy.emsi.client.time')
     def test_refresh_program_skills_rate_limit_emsi_api_calls(
             self,
             time_mock,
+            monotonic_mock,
             time_sleep_mock,
             mock_translate,
     ):
@@ -1040,19 +1087,29 @@ class TestUtils(TaxonomyTestCase):
         Validate that `refresh_program_skills` rate limits API calls to EMSI.
         """
         self.mock_access_token()
-        time_mock.return_value = 1  # Freeze time for the test.
+        # Freeze time for the test.
+        time_mock.return_value = 1
+        monotonic_mock.return_value = 1
+        TieredCache.dangerous_clear_all_tiers()
         mock_translate.return_value = {'SourceLanguageCode': '', 'TranslatedText': ''}
-        EMSISkillsApiClient.REQUEST_COUNT_CACHE.clear()
+
+        def advance_time(seconds):
+            time_mock.return_value += seconds
+            monotonic_mock.return_value += seconds
+        time_sleep_mock.side_effect = advance_time
 
         programs = []
         for _ in range(6):
             program = mock_as_dict(MockProgram())
             programs.append(program)
 
-        utils.refresh_product_skills(programs, False, ProductTypes.Program)
+        with mock.patch.object(JwtEMSIApiClient, 'RATE_LIMITER', RateLimiter(EMSI_API_RATE_LIMIT_PER_SEC)):
+            utils.refresh_product_skills(programs, False, ProductTypes.Program)
 
-        # It should be called at the 6th request made in the current second
-        assert time_sleep_mock.call_count == 1
+        # The local memory cache is not shared between processes, so every request after the first ones allowed by the
+        # bucket waits once for the next token, 1 / EMSI_API_RATE_LIMIT_PER_SEC seconds later.
+        assert time_sleep_mock.call_count == len(responses.calls) - EMSI_API_RATE_LIMIT_PER_SEC
+        assert {round(call.args[0], 6) for call in time_sleep_mock.call_args_list} == {1 / EMSI_API_RATE_LIMIT_PER_SEC}
 
     def test_get_whitelisted_serialized_skills_with_category_details(self):
         """
@@ -72,6 +72,8 @@ class TestSkillsViewSet(TestCase):
         Verify that skills API response matches the expected data.
         """
         response_data = api_response.json()
+        if 'results' in response_data:
+            response_data = response_data['results']
         assert len(response_data) == len(expected_data)
         for response_obj, expected_obj in zip(response_data, expected_data):
             self._verify_skill(response_obj, expected_obj)
@@ -95,6 +97,25 @@ class TestSkillsViewSet(TestCase):
         assert "xblocks" in response_data
         assert len(response_data["xblocks"]) == 2
 
+    def test_skills_api_courses_and_xblocks(self):
+        """
+        Verify that skills API returns course and xblock data of skills without any extra queries.
+        """
+        with self.assertNumQueries(5):
+            api_response = self.client.get(self.view_url)
+
+        response_data = api_response.json()
+        assert sorted(course['course_key'] for course in response_data[0]['courses']) == sorted(
+            course_skill.course_key for course_skill in self.course_skills
+        )
+        assert sorted(xblock['usage_key'] for xblock in response_data[0]['xblocks']) == sorted(
+            xblock_skill_data.xblock.usage_key for xblock_skill_data in self.xblock_skill_data
+        )
+        assert set(response_data[0]['courses'][0]) == {'course_key', 'confidence'}
+        assert set(response_data[0]['xblocks'][0]) == {
+            'usage_key', 'verified_count', 'ignored_count', 'verified', 'confidence',
+        }
+
     def test_skills_api_filtering(self):
         """
         Verify that skills API filters on the basis of skill names.
@@ -106,6 +127,22 @@ class TestSkillsViewSet(TestCase):
         api_response = self.client.get(url)
         self._verify_skills_data(api_response, [self.skills[0], self.skills[2]])
 
+    def test_skills_api_pagination(self):
+        """
+        Verify that skills API paginates the results using a cursor when a page is requested.
+        """
+        assert isinstance(self.client.get(self.view_url).json(), list)
+
+        api_response = self.client.get(f'{self.view_url}?page_size=2')
+        response_data = api_response.json()
+        assert response_data['previous'] is None
+        self._verify_skills_data(api_response, self.skills[:2])
+
+        api_response = self.client.get(response_data['next'])
+        response_data = api_response.json()
+        assert response_data['next'] is None
+        self._verify_skills_data(api_response, self.skills[2:])
+
 
 @mark.django_db
 class TestJobsViewSet(TestCase):
@@ -155,6 +192,17 @@ class TestJobsViewSet(TestCase):
         assert job_b_response['skills'][1]['skill']['id'] == self.job_skill_c.skill.id
         assert job_b_response['skills'][1]['skill']['name'] == self.job_skill_c.skill.name
 
+    def test_jobs_api_skills_prefetched(self):
+        """
+        Verify that jobs API loads the whitelisted skills of all jobs without a query per job.
+        """
+        JobSkillFactory(job=self.job_a, is_blacklisted=True)
+        with self.assertNumQueries(4):
+            api_response = self.client.get(self.view_url)
+
+        api_response = api_response.json()
+        assert [len(job['skills']) for job in api_response] == [1, 2]
+
 
 @mark.django_db
 class TestJobPostingsViewSet(TestCase):
@@ -246,6 +294,20 @@ class TestSkillsQuizViewSet(TestCase):
         api_response = client.get(self.view_url)
         self._verify_skills_quiz_data(api_response, [self.skills_quiz_a, self.skills_quiz_b, self.skills_quiz_c])
 
+    def test_skills_quiz_api_stream(self):
+        """
+        Verify that skills quiz API streams the quizzes as JSON Lines when requested.
+        """
+        api_response = self.client.get(self.view_url, {'stream': '1'})
+        assert api_response.status_code == status.HTTP_200_OK
+        assert api_response['Content-Type'] == 'application/x-ndjson'
+        streamed_quizzes = [
+            json.loads(line) for line in b''.join(api_response.streaming_content).decode().splitlines()
+        ]
+        assert [quiz['id'] for quiz in streamed_quizzes] == [self.skills_quiz_a.id, self.skills_quiz_b.id]
+        assert streamed_quizzes[0]['current_job'] == self.skills_quiz_a.current_job.id
+        assert streamed_quizzes[0]['future_jobs'] == list(self.skills_quiz_a.future_jobs.values_list('id', flat=True))
+
     def test_skills_quiz_api_post(self):
         """
         Verify skills quiz API post endpoint works correctly.
@@ -297,6 +359,7 @@ class TestJobTopSkillCategoriesAPIView(TestCase):
         Setup env.
         """
         super(TestJobTopSkillCategoriesAPIView, self).setUp()
+        TieredCache.dangerous_clear_all_tiers()
         self.user = User.objects.create(username="rocky", is_staff=True)
         self.user.set_password(USER_PASSWORD)
         self.user.save()
@@ -395,7 +458,7 @@ class TestJobTopSkillCategoriesAPIView(TestCase):
                 skills_count=randint(10, 15)
             )
 
-        with self.assertNumQueries(7):
+        with self.assertNumQueries(5):
             api_response = self.client.get(self.view_url)
 
         assert api_response.status_code == 200
@@ -418,6 +481,42 @@ class TestJobTopSkillCategoriesAPIView(TestCase):
         for index in range(5):
             self._assert_skill_category_data(data['skill_categories'][index], self.job)
 
+    def test_cached_response(self):
+        """
+        Test that the API response is served from cache on subsequent requests.
+        """
+        self._create_job_skills_and_skill_category(self.job, sub_category_count=2, skills_count=10)
+        api_response = self.client.get(self.view_url)
+        assert api_response.status_code == 200
+
+        # Only session and user queries are made on a cache hit.
+        with self.assertNumQueries(2):
+            cached_api_response = self.client.get(self.view_url)
+
+        assert cached_api_response.status_code == 200
+        assert cached_api_response.json() == api_response.json()
+
+    def test_cache_invalidated_on_job_skill_change(self):
+        """
+        Test that the cached response is invalidated when a skill of the job is added or removed.
+        """
+        category = SkillCategoryFactory()
+        sub_category = SkillSubCategoryFactory(category=category)
+        job_skill = JobSkillFactory(
+            job=self.job,
+            skill=SkillFactory(category=category, subcategory=sub_category),
+        )
+        api_response = self.client.get(self.view_url)
+        assert len(api_response.json()['skill_categories'][0]['skills']) == 1
+
+        JobSkillFactory(job=self.job, skill=SkillFactory(category=category, subcategory=sub_category))
+        api_response = self.client.get(self.view_url)
+        assert len(api_response.json()['skill_categories'][0]['skills']) == 2
+
+        job_skill.delete()
+        api_response = self.client.get(self.view_url)
+        assert len(api_response.json()['skill_categories'][0]['skills']) == 1
+
 
 @mark.django_db
 class TestLearnersCurrentJobAPIView(TestCase):
@@ -520,6 +619,28 @@ class TestJobHolderUsernamesAPIView(TestCase):
         # assert that all usernames are unique in usernames list
         assert len(data['usernames']) == len(set(data['usernames']))
 
+    def test_usernames_are_unique_and_ordered_by_latest_attempt(self):
+        """
+        Test that usernames are de-duplicated and ordered by the most recent skills quiz attempt.
+        """
+        SkillsQuizFactory(current_job=self.job, username='user1')
+        SkillsQuizFactory(current_job=self.job, username='user2')
+        SkillsQuizFactory(current_job=self.job, username='user1')
+        SkillsQuizFactory(current_job=JobFactory(), username='user3')
+
+        api_response = self.client.get(self.view_url)
+
+        assert api_response.status_code == 200
+        assert api_response.json()['usernames'] == ['user1', 'user2']
+
+    def test_job_not_found(self):
+        """
+        Test that the API returns 404 for a job that does not exist.
+        """
+        view_url = reverse('job_holder_usernames', kwargs={"job_id": self.job.id + 1})
+        api_response = self.client.get(view_url)
+        assert api_response.status_code == 404
+
 
 @mark.django_db
 class TestXBlockSkillsViewSet(TestCase):
@@ -529,6 +650,7 @@ class TestXBlockSkillsViewSet(TestCase):
 
     def setUp(self) -> None:
         super(TestXBlockSkillsViewSet, self).setUp()
+        TieredCache.dangerous_clear_all_tiers()
         self.skills = SkillFactory.simple_generate_batch(True, 5)
         self.xblock_skills = XBlockSkillsFactory.simple_generate_batch(True, 3)
         self.xblock_skill_data_objs = XBlockSkillDataFactory.simple_generate_batch(
@@ -627,6 +749,15 @@ class TestXBlockSkillsViewSet(TestCase):
             assert api_response.status_code == 200
             assert api_response.json() == []
 
+    def test_xblocks_api_skill_validation_checked_once(self):
+        """
+        Verify that skill validation configuration is looked up only once per request.
+        """
+        with mock.patch.object(SkillValidationConfiguration, 'is_disabled', return_value=False) as mock_is_disabled:
+            api_response = self.client.get(self.view_url, {"course_key": 'course-v1:edX+M12+1T2024'})
+            assert api_response.status_code == 200
+            mock_is_disabled.assert_called_once_with('course-v1:edX+M12+1T2024')
+
     def test_list_xblock_skills_cache_hit(self):
         cached_data = {'results': [{'id': str(self.xblock_skills[0].id)}]}
         with patch.object(
@@ -672,7 +803,7 @@ class TestJobPathAPIView(TestCase):
         self.client.login(username=self.user.username, password=USER_PASSWORD)
         self.view_url = '/api/v1/job-path/'
 
-    @patch('taxonomy.openai.client.requests.post')
+    @patch('taxonomy.openai.client.SESSION.post')
     @patch(
         'taxonomy.api.v1.serializers.generate_and_store_job_to_job_description',
         wraps=generate_and_store_job_to_job_description